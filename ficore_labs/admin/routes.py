@@ -1,5 +1,6 @@
 import logging
 from bson import ObjectId, errors
+from pymongo import InsertOne
 from flask import Blueprint, render_template, redirect, url_for, flash, request, session, Response, send_file
 from flask_login import login_required, current_user
 from flask_wtf import FlaskForm
@@ -87,15 +88,12 @@ class FeedbackFilterForm(FlaskForm):
 def log_audit_action(action, details=None):
     """Log an admin action to audit_logs collection."""
     try:
-        db = utils.get_mongo_db()
-        if db is None:
-            raise Exception("Failed to connect to MongoDB")
-        db.audit_logs.insert_one({
+        utils.queue_write('audit_logs', InsertOne({
             'admin_id': str(current_user.id),
             'action': action,
             'details': details or {},
             'timestamp': datetime.now(timezone.utc)
-        })
+        }))
     except Exception as e:
         logger.error(f"Error logging audit action '{action}': {str(e)}",
                      extra={'session_id': session.get('sid', 'no-session-id'), 'user_id': current_user.id})
@@ -187,14 +185,13 @@ def suspend_user(user_id):
         if db is None:
             raise Exception("Failed to connect to MongoDB")
         user_query = {'_id': ObjectId(user_id)}
-        user = db.users.find_one(user_query)
-        if user is None:
-            flash(trans('admin_user_not_found', default='User not found'), 'danger')
-            return redirect(url_for('admin.manage_users'))
         result = db.users.update_one(
             user_query,
             {'$set': {'suspended': True, 'updated_at': datetime.now(timezone.utc)}}
         )
+        if result.matched_count == 0:
+            flash(trans('admin_user_not_found', default='User not found'), 'danger')
+            return redirect(url_for('admin.manage_users'))
         if result.modified_count == 0:
             flash(trans('admin_user_not_updated', default='User could not be suspended'), 'danger')
         else:
@@ -437,10 +434,15 @@ def manage_receipts():
         # Get all payment receipts with user information
         receipts = list(db.payment_receipts.find().sort('uploaded_at', -1))
         
-        # Enrich receipts with user information
+        # Enrich receipts with user information from a single batched lookup
+        user_ids = list({receipt['user_id'] for receipt in receipts})
+        users_by_id = {
+            user['_id']: user
+            for user in db.users.find({'_id': {'$in': user_ids}}, {'email': 1, 'display_name': 1})
+        } if user_ids else {}
         for receipt in receipts:
             receipt['_id'] = str(receipt['_id'])
-            user = db.users.find_one({'_id': receipt['user_id']})
+            user = users_by_id.get(receipt['user_id'])
             receipt['user_email'] = user.get('email', 'Unknown') if user else 'Unknown'
             receipt['user_display_name'] = user.get('display_name', receipt['user_id']) if user else receipt['user_id']
         
@@ -467,17 +469,16 @@ def approve_receipt(receipt_id):
         if db is None:
             raise Exception("Failed to connect to MongoDB")
         
-        receipt = db.payment_receipts.find_one({'_id': ObjectId(receipt_id)})
+        # Update receipt status and read the fields needed below in one round trip
+        receipt = db.payment_receipts.find_one_and_update(
+            {'_id': ObjectId(receipt_id)},
+            {'$set': {'status': 'approved', 'approved_by': current_user.id, 'approved_at': datetime.now(timezone.utc)}},
+            projection={'user_id': 1, 'plan_type': 1, 'amount_paid': 1}
+        )
         if not receipt:
             flash(trans('admin_receipt_not_found', default='Receipt not found'), 'danger')
             return redirect(url_for('admin.manage_receipts'))
         
-        # Update receipt status
-        db.payment_receipts.update_one(
-            {'_id': ObjectId(receipt_id)},
-            {'$set': {'status': 'approved', 'approved_by': current_user.id, 'approved_at': datetime.now(timezone.utc)}}
-        )
-        
         # Activate user subscription
         plan_duration = 30 if receipt['plan_type'] == 'monthly' else 365
         subscription_end = datetime.now(timezone.utc) + timedelta(days=plan_duration)
@@ -525,24 +526,23 @@ def reject_receipt(receipt_id):
         if db is None:
             raise Exception("Failed to connect to MongoDB")
         
-        receipt = db.payment_receipts.find_one({'_id': ObjectId(receipt_id)})
-        if not receipt:
-            flash(trans('admin_receipt_not_found', default='Receipt not found'), 'danger')
-            return redirect(url_for('admin.manage_receipts'))
-        
         # Get rejection reason
         rejection_reason = request.form.get('rejection_reason', '').strip()
         
-        # Update receipt status
-        db.payment_receipts.update_one(
+        # Update receipt status and read its owner in one round trip
+        receipt = db.payment_receipts.find_one_and_update(
             {'_id': ObjectId(receipt_id)},
             {'$set': {
                 'status': 'rejected',
                 'rejected_by': current_user.id,
                 'rejected_at': datetime.now(timezone.utc),
                 'rejection_reason': rejection_reason
-            }}
+            }},
+            projection={'user_id': 1}
         )
+        if not receipt:
+            flash(trans('admin_receipt_not_found', default='Receipt not found'), 'danger')
+            return redirect(url_for('admin.manage_receipts'))
         
         # Log the action
         log_audit_action('reject_receipt', {
@@ -1099,7 +1099,7 @@ def generate_customer_report_pdf(users):
     """Generate a PDF report of customer data."""
     try:
         buffer = BytesIO()
-        p = canvas.Canvas(buffer, pagesize=A4)
+        p = canvas.Canvas(buffer, pagesize=A4, pageCompression=1)
         p.setFont("Helvetica", 12)
         p.drawString(1 * inch, 10.5 * inch, trans('admin_customer_report_title', default='Customer Report'))
         p.drawString(1 * inch, 10.2 * inch, f"{trans('admin_generated_on', default='Generated on')}: {datetime.now(timezone.utc).strftime('%Y-%m-%d')}")
@@ -1123,7 +1123,7 @@ def generate_customer_report_pdf(users):
         p.showPage()
         p.save()
         buffer.seek(0)
-        return Response(buffer, mimetype='application/pdf', headers={'Content-Disposition': 'attachment;filename=customer_report.pdf'})
+        return send_file(buffer, mimetype='application/pdf', as_attachment=True, download_name='customer_report.pdf')
     except Exception as e:
         logger.error(f"Error generating customer report PDF: {str(e)}",
                      extra={'session_id': session.get('sid', 'no-session-id'), 'user_id': current_user.id})
@@ -1152,7 +1152,7 @@ def generate_investor_report_pdf(report_data):
     """Generate a PDF report for investors."""
     try:
         buffer = BytesIO()
-        p = canvas.Canvas(buffer, pagesize=A4)
+        p = canvas.Canvas(buffer, pagesize=A4, pageCompression=1)
         p.setFont("Helvetica", 12)
         p.drawString(1 * inch, 10.5 * inch, trans('admin_investor_report_title', default='Investor Report'))
         p.drawString(1 * inch, 10.2 * inch, f"{trans('admin_generated_on', default='Generated on')}: {datetime.now(timezone.utc).strftime('%Y-%m-%d')}")
@@ -1171,7 +1171,7 @@ def generate_investor_report_pdf(report_data):
         p.showPage()
         p.save()
         buffer.seek(0)
-        return Response(buffer, mimetype='application/pdf', headers={'Content-Disposition': 'attachment;filename=investor_report.pdf'})
+        return send_file(buffer, mimetype='application/pdf', as_attachment=True, download_name='investor_report.pdf')
     except Exception as e:
         logger.error(f"Error generating investor report PDF: {str(e)}",
                      extra={'session_id': session.get('sid', 'no-session-id'), 'user_id': current_user.id})
@@ -2,6 +2,7 @@ import os
 import sys
 import logging
 import uuid
+import json
 from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
 from flask import (
@@ -23,7 +24,7 @@ from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from users.routes import get_post_login_redirect
 from utils import (
-    get_mongo_db, logger, initialize_tools_with_urls, generate_tools_with_urls,
+    get_mongo_db, logger, initialize_tools_with_urls, generate_tools_with_urls, flush_pending_writes, ORJSONProvider,
     TRADER_TOOLS, TRADER_NAV, STARTUP_TOOLS, STARTUP_NAV, ADMIN_TOOLS, ADMIN_NAV,
     _TRADER_NAV, _STARTUP_NAV, _ADMIN_NAV, _TRADER_TOOLS, _STARTUP_TOOLS, _ADMIN_TOOLS, format_date
 )
@@ -40,6 +41,13 @@ babel = Babel()
 compress = Compress()
 limiter = Limiter(key_func=get_remote_address, default_limits=['200 per day', '50 per hour'], storage_uri='memory://')
 
+# Static JSON bodies, serialized once at import instead of on every request
+HEALTHY_RESPONSE_BODY = json.dumps({'status': 'healthy'}, separators=(',', ':'))
+LANGUAGE_SET_RESPONSE_BODIES = {
+    lang: json.dumps({'lang': lang, 'success': True}, separators=(',', ':'))
+    for lang in ('en', 'ha')
+}
+
 # Decorators
 def admin_required(f):
     @wraps(f)
@@ -192,7 +200,7 @@ class User(UserMixin):
     def get(self, key, default=None):
         try:
             with current_app.app_context():
-                user = current_app.extensions['mongo']['bizdb'].users.find_one({'_id': self.id})
+                user = current_app.extensions['mongo']['bizdb'].users.find_one({'_id': self.id}, {key: 1})
                 return user.get(key, default) if user else default
         except Exception as e:
             logger.error(f'Error fetching user data for {self.id}: {str(e)}', extra={'session_id': session.get('sid', 'no-session-id'), 'ip_address': request.remote_addr})
@@ -203,7 +211,7 @@ class User(UserMixin):
         """Get user settings with defaults"""
         try:
             with current_app.app_context():
-                user = current_app.extensions['mongo']['bizdb'].users.find_one({'_id': self.id})
+                user = current_app.extensions['mongo']['bizdb'].users.find_one({'_id': self.id}, {'settings': 1})
                 if user and 'settings' in user:
                     return user['settings']
                 # Return default settings if none exist
@@ -226,7 +234,7 @@ class User(UserMixin):
     def is_active(self):
         try:
             with current_app.app_context():
-                user = current_app.extensions['mongo']['bizdb'].users.find_one({'_id': self.id})
+                user = current_app.extensions['mongo']['bizdb'].users.find_one({'_id': self.id}, {'is_active': 1})
                 return user.get('is_active', True) if user else False
         except Exception as e:
             logger.error(f'Error checking active status for user {self.id}: {str(e)}', extra={'session_id': session.get('sid', 'no-session-id'), 'ip_address': request.remote_addr})
@@ -260,6 +268,7 @@ class User(UserMixin):
 
 def create_app():
     app = Flask(__name__, template_folder='templates', static_folder='static')
+    app.json = ORJSONProvider(app)
     CORS(app, resources={r"/api/*": {"origins": "*"}})
 
     # Load configuration
@@ -406,9 +415,11 @@ def create_app():
     logger.info('Registered all blueprints including KYC and Settings', extra={'session_id': 'none', 'user_role': 'none', 'ip_address': 'none'})
 
     # Define format_currency filter
-    def format_currency(value):
+    def format_currency(value, _fmt="₦{:,.2f}".format):
+        if type(value) is float or type(value) is int:
+            return _fmt(value)
         try:
-            return "₦{:,.2f}".format(float(value))
+            return _fmt(float(value))
         except (ValueError, TypeError) as e:
             logger.warning(f'Error formatting currency {value}: {str(e)}', extra={'session_id': session.get('sid', 'no-session-id'), 'ip_address': request.remote_addr})
             return str(value)
@@ -461,14 +472,22 @@ def create_app():
     # Initialize tools and navigation after blueprints
     @app.before_request
     def initialize_navigation():
+        # Tool URLs are external, so only re-resolve them when the request host changes
+        host_url = request.host_url
+        if app.extensions.get('navigation_host_url') == host_url:
+            return
         with app.app_context():
             try:
                 initialize_tools_with_urls(app)
+                app.extensions['navigation_host_url'] = host_url
                 logger.info('Navigation initialized after blueprint registration', extra={'session_id': session.get('sid', 'no-session-id'), 'ip_address': request.remote_addr})
             except Exception as e:
                 logger.error(f'Failed to initialize navigation: {str(e)}', extra={'session_id': session.get('sid', 'no-session-id'), 'ip_address': request.remote_addr})
                 raise
 
+    # Flush audit/activity writes queued during the request in one bulk_write per collection
+    app.after_request(flush_pending_writes)
+
     # Ensure session['lang'] is set early and respected
     @app.before_request
     def ensure_lang_in_session():
@@ -513,11 +532,25 @@ def create_app():
             logger.warning(f'Error formatting datetime {value}: {str(e)}', extra={'session_id': session.get('sid', 'no-session-id'), 'ip_address': request.remote_addr})
             return str(value)
 
+    # Resolved nav/tool lists keyed by (host URL, template); URLs are external, so they are only valid for the host that built them
+    nav_cache = {}
+    NAV_CACHE_MAX_ENTRIES = 64
+
     @app.context_processor
     def inject_globals():
         def build_nav(nav_template):
+            cache_key = (request.host_url, id(nav_template))
+            cached = nav_cache.get(cache_key)
+            if cached is not None:
+                return cached
             try:
-                return generate_tools_with_urls(nav_template)
+                resolved = generate_tools_with_urls(nav_template)
+                # Skip caching '#' fallbacks from failed url_for builds, and bound growth from arbitrary Host headers
+                if all(item['url'] != '#' for item in resolved):
+                    if len(nav_cache) >= NAV_CACHE_MAX_ENTRIES:
+                        nav_cache.clear()
+                    nav_cache[cache_key] = resolved
+                return resolved
             except Exception as e:
                 logger.error(f"Error building nav: {e}")
                 return []
@@ -583,14 +616,13 @@ def create_app():
     @limiter.limit('10 per minute')
     def health():
         logger.info('Performing health check', extra={'session_id': session.get('sid', 'no-session-id'), 'ip_address': request.remote_addr})
-        status = {'status': 'healthy'}
         try:
             with app.app_context():
                 app.extensions['mongo'].admin.command('ping')
-            return jsonify(status), 200
+            return Response(HEALTHY_RESPONSE_BODY, status=200, mimetype='application/json')
         except Exception as e:
             logger.error(f'Health check failed: {str(e)}', extra={'session_id': session.get('sid', 'no-session-id'), 'ip_address': request.remote_addr})
-            status['status'] = 'unhealthy'
+            status = {'status': 'unhealthy'}
             status['details'] = str(e)
             return jsonify(status), 500
 
@@ -637,7 +669,7 @@ def create_app():
         session['last_activity'] = datetime.now(timezone.utc).isoformat()
         session.modified = True
         logger.info(f"Language set to {session['lang']} for session {session.get('sid', 'no-session-id')}", extra={'session_id': session.get('sid', 'no-session-id'), 'ip_address': request.remote_addr})
-        return jsonify({'success': True, 'lang': session['lang']})
+        return Response(LANGUAGE_SET_RESPONSE_BODIES[lang], mimetype='application/json')
 
     @app.errorhandler(404)
     def page_not_found(e):
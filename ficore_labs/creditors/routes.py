@@ -1,4 +1,4 @@
-from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify, Response, session
+from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify, session, send_file
 from flask_login import login_required, current_user
 from flask_wtf import FlaskForm
 from wtforms import StringField, FloatField, TextAreaField, SubmitField
@@ -49,11 +49,14 @@ def index():
         creditors = list(db.records.find(query).sort('created_at', -1))
         
         # Convert naive datetimes to timezone-aware
+        utc = ZoneInfo("UTC")
         for creditor in creditors:
-            if creditor.get('created_at') and creditor['created_at'].tzinfo is None:
-                creditor['created_at'] = creditor['created_at'].replace(tzinfo=ZoneInfo("UTC"))
-            if creditor.get('reminder_date') and creditor['reminder_date'].tzinfo is None:
-                creditor['reminder_date'] = creditor['reminder_date'].replace(tzinfo=ZoneInfo("UTC"))
+            created_at = creditor.get('created_at')
+            if created_at and created_at.tzinfo is None:
+                creditor['created_at'] = created_at.replace(tzinfo=utc)
+            reminder_date = creditor.get('reminder_date')
+            if reminder_date and reminder_date.tzinfo is None:
+                creditor['reminder_date'] = reminder_date.replace(tzinfo=utc)
         
         # Check if user can interact (for template rendering)
         can_interact = utils.can_user_interact(current_user)
@@ -81,11 +84,14 @@ def manage():
         creditors = list(db.records.find(query).sort('created_at', -1))
         
         # Convert naive datetimes to timezone-aware
+        utc = ZoneInfo("UTC")
         for creditor in creditors:
-            if creditor.get('created_at') and creditor['created_at'].tzinfo is None:
-                creditor['created_at'] = creditor['created_at'].replace(tzinfo=ZoneInfo("UTC"))
-            if creditor.get('reminder_date') and creditor['reminder_date'].tzinfo is None:
-                creditor['reminder_date'] = creditor['reminder_date'].replace(tzinfo=ZoneInfo("UTC"))
+            created_at = creditor.get('created_at')
+            if created_at and created_at.tzinfo is None:
+                creditor['created_at'] = created_at.replace(tzinfo=utc)
+            reminder_date = creditor.get('reminder_date')
+            if reminder_date and reminder_date.tzinfo is None:
+                creditor['reminder_date'] = reminder_date.replace(tzinfo=utc)
         
         # Check if user can interact (for template rendering)
         can_interact = utils.can_user_interact(current_user)
@@ -315,25 +321,21 @@ def generate_iou(id):
         creditor['contact'] = utils.sanitize_input(creditor.get('contact', 'N/A'), max_length=50)
         
         buffer = io.BytesIO()
-        p = canvas.Canvas(buffer, pagesize=letter)
-        width, height = letter
+        p = canvas.Canvas(buffer, pagesize=letter, pageCompression=1)
+        height = letter[1]
         
         p.setFont("Helvetica-Bold", 24)
         p.drawString(inch, height - inch, "FiCore Records - IOU")
         
-        p.setFont("Helvetica", 12)
-        y_position = height - inch - 0.5 * inch
-        p.drawString(inch, y_position, f"Creditor: {creditor['name']}")
-        y_position -= 0.3 * inch
-        p.drawString(inch, y_position, f"Amount Owed: {utils.format_currency(creditor['amount_owed'])}")
-        y_position -= 0.3 * inch
-        p.drawString(inch, y_position, f"Contact: {creditor['contact']}")
-        y_position -= 0.3 * inch
-        p.drawString(inch, y_position, f"Description: {creditor['description']}")
-        y_position -= 0.3 * inch
-        p.drawString(inch, y_position, f"Date Recorded: {utils.format_date(creditor['created_at'])}")
-        y_position -= 0.3 * inch
-        p.drawString(inch, y_position, f"Reminders Sent: {creditor.get('reminder_count', 0)}")
+        text = p.beginText(inch, height - inch - 0.5 * inch)
+        text.setFont("Helvetica", 12, leading=0.3 * inch)
+        text.textLine(f"Creditor: {creditor['name']}")
+        text.textLine(f"Amount Owed: {utils.format_currency(creditor['amount_owed'])}")
+        text.textLine(f"Contact: {creditor['contact']}")
+        text.textLine(f"Description: {creditor['description']}")
+        text.textLine(f"Date Recorded: {utils.format_date(creditor['created_at'])}")
+        text.textLine(f"Reminders Sent: {creditor.get('reminder_count', 0)}")
+        p.drawText(text)
         
         p.setFont("Helvetica-Oblique", 10)
         p.drawString(inch, inch, "This document serves as an IOU recorded on FiCore Records.")
@@ -342,12 +344,11 @@ def generate_iou(id):
         p.save()
         
         buffer.seek(0)
-        return Response(
-            buffer.getvalue(),
+        return send_file(
+            buffer,
             mimetype='application/pdf',
-            headers={
-                'Content-Disposition': f'attachment; filename=FiCore_IOU_{utils.sanitize_input(creditor["name"], max_length=50)}.pdf'
-            }
+            as_attachment=True,
+            download_name=f'FiCore_IOU_{creditor["name"][:50]}.pdf'
         )
         
     except ValueError:
@@ -475,10 +476,6 @@ def delete(id):
         
         db = utils.get_mongo_db()
         query = {'_id': ObjectId(id), 'user_id': str(current_user.id), 'type': 'creditor'}
-        creditor = db.records.find_one(query)
-        if not creditor:
-            flash(trans('creditors_record_not_found', default='Record not found'), 'danger')
-            return redirect(url_for('creditors.index'))
         result = db.records.delete_one(query)
         if result.deleted_count:
             flash(trans('creditors_delete_success', default='Creditor deleted successfully'), 'success')
@@ -13,6 +13,24 @@ logger = logging.getLogger(__name__)
 
 dashboard_bp = Blueprint('dashboard', __name__, url_prefix='/dashboard')
 
+# Fields the dashboard lists actually render; everything else stays on the server
+RECENT_RECORD_FIELDS = {
+    'name': 1, 'source': 1, 'contact': 1, 'description': 1, 'amount': 1, 'amount_owed': 1,
+    'reminder_count': 1, 'reminder_date': 1, 'created_at': 1
+}
+RECENT_CASHFLOW_FIELDS = {
+    'party_name': 1, 'recipient': 1, 'payer': 1, 'description': 1, 'amount': 1, 'created_at': 1
+}
+
+def recent_pipeline(record_type, fields, limit=5):
+    """$facet sub-pipeline returning the latest documents of one type, projected to fields."""
+    return [
+        {'$match': {'type': record_type}},
+        {'$sort': {'created_at': -1}},
+        {'$limit': limit},
+        {'$project': fields}
+    ]
+
 # API endpoint for weekly profit data (for dashboard chart)
 @dashboard_bp.route('/weekly_profit_data')
 @login_required
@@ -22,22 +40,23 @@ def weekly_profit_data():
     today = datetime.now(timezone.utc)
     # Get last 7 days
     days = [(today - timedelta(days=i)).date() for i in range(6, -1, -1)]
+    start = datetime(days[0].year, days[0].month, days[0].day, tzinfo=timezone.utc)
+    end = datetime(days[-1].year, days[-1].month, days[-1].day, tzinfo=timezone.utc) + timedelta(days=1)
+    # Sum sales and expenses per day and type in a single pass over the week
+    daily_totals = {
+        (row['_id']['day'], row['_id']['type']): row['total']
+        for row in db.records.aggregate([
+            {'$match': {'user_id': user_id, 'type': {'$in': ['sale', 'expense']}, 'created_at': {'$gte': start, '$lt': end}}},
+            {'$group': {
+                '_id': {'day': {'$dateToString': {'format': '%Y-%m-%d', 'date': '$created_at'}}, 'type': '$type'},
+                'total': {'$sum': '$amount'}
+            }}
+        ])
+    }
     profit_per_day = []
     for day in days:
-        start = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
-        end = start + timedelta(days=1)
-        # Sum sales and expenses for the day
-        sales = db.records.aggregate([
-            {'$match': {'user_id': user_id, 'type': 'sale', 'created_at': {'$gte': start, '$lt': end}}},
-            {'$group': {'_id': None, 'total': {'$sum': '$amount'}}}
-        ])
-        expenses = db.records.aggregate([
-            {'$match': {'user_id': user_id, 'type': 'expense', 'created_at': {'$gte': start, '$lt': end}}},
-            {'$group': {'_id': None, 'total': {'$sum': '$amount'}}}
-        ])
-        sales_total = next(sales, {}).get('total', 0)
-        expenses_total = next(expenses, {}).get('total', 0)
-        profit = sales_total - expenses_total
+        key = day.isoformat()
+        profit = daily_totals.get((key, 'sale'), 0) - daily_totals.get((key, 'expense'), 0)
         profit_per_day.append({
             'date': day.strftime('%a'),
             'profit': profit
@@ -75,6 +94,7 @@ def index():
     unpaid_debtors = []
     unpaid_creditors = []
     inventory_loss = False
+    totals = {}
 
     try:
         db = utils.get_mongo_db()
@@ -110,26 +130,55 @@ def index():
                 stats['profit_only'] = next(sales, {}).get('total', 0) - next(expenses, {}).get('total', 0)
                 stats['total_receipts'] = stats['total_payments'] = stats['total_funds'] = 0
                 stats['total_receipts_amount'] = stats['total_payments_amount'] = stats['total_funds_amount'] = 0
-            recent_creditors = list(db.records.find({**query, 'type': 'creditor'}).sort('created_at', -1).limit(5))
-            recent_debtors = list(db.records.find({**query, 'type': 'debtor'}).sort('created_at', -1).limit(5))
-            recent_payments = list(db.cashflows.find({**query, 'type': 'payment'}).sort('created_at', -1).limit(5))
-            recent_receipts = list(db.cashflows.find({**query, 'type': 'receipt'}).sort('created_at', -1).limit(5))
-            recent_funds = list(db.records.find({**query, 'type': 'fund'}).sort('created_at', -1).limit(5))
+            # One $facet per collection returns the recent items and the per-type totals together
+            records_facet = next(db.records.aggregate([
+                {'$match': {**query, 'type': {'$in': ['creditor', 'debtor', 'fund', 'forecast']}}},
+                {'$facet': {
+                    'recent_creditors': recent_pipeline('creditor', RECENT_RECORD_FIELDS),
+                    'recent_debtors': recent_pipeline('debtor', RECENT_RECORD_FIELDS),
+                    'recent_funds': recent_pipeline('fund', RECENT_RECORD_FIELDS),
+                    'totals': [{'$group': {
+                        '_id': '$type',
+                        'count': {'$sum': 1},
+                        'amount_owed': {'$sum': '$amount_owed'},
+                        'amount': {'$sum': '$amount'},
+                        'projected_revenue': {'$sum': '$projected_revenue'}
+                    }}]
+                }}
+            ]), {})
+            cashflows_facet = next(db.cashflows.aggregate([
+                {'$match': {**query, 'type': {'$in': ['payment', 'receipt']}}},
+                {'$facet': {
+                    'recent_payments': recent_pipeline('payment', RECENT_CASHFLOW_FIELDS),
+                    'recent_receipts': recent_pipeline('receipt', RECENT_CASHFLOW_FIELDS),
+                    'totals': [{'$group': {
+                        '_id': '$type',
+                        'count': {'$sum': 1},
+                        'amount': {'$sum': '$amount'}
+                    }}]
+                }}
+            ]), {})
+            recent_creditors = records_facet.get('recent_creditors', [])
+            recent_debtors = records_facet.get('recent_debtors', [])
+            recent_funds = records_facet.get('recent_funds', [])
+            recent_payments = cashflows_facet.get('recent_payments', [])
+            recent_receipts = cashflows_facet.get('recent_receipts', [])
+            totals = {t['_id']: t for t in records_facet.get('totals', []) + cashflows_facet.get('totals', [])}
         except Exception as e:
             logger.error(f"Error querying MongoDB for dashboard data: {str(e)}", 
                         extra={'session_id': session.get('sid', 'no-session-id'), 'user_id': current_user.id})
             flash(trans('dashboard_load_error', default='Failed to load some dashboard data. Displaying available information.'), 'warning')
 
-        # Sanitize and convert datetimes
+        # Convert datetimes; text fields were sanitized on write and are autoescaped by Jinja
         for item in recent_creditors + recent_debtors:
             try:
                 if item.get('created_at') and item['created_at'].tzinfo is None:
                     item['created_at'] = item['created_at'].replace(tzinfo=ZoneInfo("UTC"))
                 if item.get('reminder_date') and item['reminder_date'].tzinfo is None:
                     item['reminder_date'] = item['reminder_date'].replace(tzinfo=ZoneInfo("UTC"))
-                item['name'] = utils.sanitize_input(item.get('name', ''), max_length=100)
-                item['description'] = utils.sanitize_input(item.get('description', 'No description provided'), max_length=500)
-                item['contact'] = utils.sanitize_input(item.get('contact', 'N/A'), max_length=50)
+                item['name'] = item.get('name') or ''
+                item['description'] = item.get('description', 'No description provided') or ''
+                item['contact'] = item.get('contact', 'N/A') or ''
                 item['_id'] = str(item['_id'])
             except Exception as e:
                 logger.warning(f"Error processing creditor/debtor item {item.get('_id')}: {str(e)}")
@@ -139,7 +188,7 @@ def index():
             try:
                 if item.get('created_at') and item['created_at'].tzinfo is None:
                     item['created_at'] = item['created_at'].replace(tzinfo=ZoneInfo("UTC"))
-                item['description'] = utils.sanitize_input(item.get('description', 'No description provided'), max_length=500)
+                item['description'] = item.get('description', 'No description provided') or ''
                 item['_id'] = str(item['_id'])
             except Exception as e:
                 logger.warning(f"Error processing payment/receipt item {item.get('_id')}: {str(e)}")
@@ -149,8 +198,8 @@ def index():
             try:
                 if item.get('created_at') and item['created_at'].tzinfo is None:
                     item['created_at'] = item['created_at'].replace(tzinfo=ZoneInfo("UTC"))
-                item['name'] = utils.sanitize_input(item.get('name', ''), max_length=100)
-                item['description'] = utils.sanitize_input(item.get('description', 'No description provided'), max_length=500)
+                item['name'] = item.get('name') or ''
+                item['description'] = item.get('description', 'No description provided') or ''
                 item['_id'] = str(item['_id'])
             except Exception as e:
                 logger.warning(f"Error processing fund item {item.get('_id')}: {str(e)}")
@@ -158,19 +207,22 @@ def index():
 
         # Calculate stats with safe access
         try:
+            def total(record_type, field='count'):
+                return totals.get(record_type, {}).get(field, 0)
+
             stats.update({
-                'total_debtors': db.records.count_documents({**query, 'type': 'debtor'}),
-                'total_creditors': db.records.count_documents({**query, 'type': 'creditor'}),
-                'total_payments': db.cashflows.count_documents({**query, 'type': 'payment'}),
-                'total_receipts': db.cashflows.count_documents({**query, 'type': 'receipt'}),
-                'total_funds': db.records.count_documents({**query, 'type': 'fund'}),
-                'total_debtors_amount': sum(doc.get('amount_owed', 0) for doc in db.records.find({**query, 'type': 'debtor'})),
-                'total_creditors_amount': sum(doc.get('amount_owed', 0) for doc in db.records.find({**query, 'type': 'creditor'})),
-                'total_payments_amount': sum(doc.get('amount', 0) for doc in db.cashflows.find({**query, 'type': 'payment'})),
-                'total_receipts_amount': sum(doc.get('amount', 0) for doc in db.cashflows.find({**query, 'type': 'receipt'})),
-                'total_funds_amount': sum(doc.get('amount', 0) for doc in db.records.find({**query, 'type': 'fund'})),
-                'total_forecasts': db.records.count_documents({**query, 'type': 'forecast'}),
-                'total_forecasts_amount': sum(doc.get('projected_revenue', 0) for doc in db.records.find({**query, 'type': 'forecast'}))
+                'total_debtors': total('debtor'),
+                'total_creditors': total('creditor'),
+                'total_payments': total('payment'),
+                'total_receipts': total('receipt'),
+                'total_funds': total('fund'),
+                'total_debtors_amount': total('debtor', 'amount_owed'),
+                'total_creditors_amount': total('creditor', 'amount_owed'),
+                'total_payments_amount': total('payment', 'amount'),
+                'total_receipts_amount': total('receipt', 'amount'),
+                'total_funds_amount': total('fund', 'amount'),
+                'total_forecasts': total('forecast'),
+                'total_forecasts_amount': total('forecast', 'projected_revenue')
             })
         except Exception as e:
             logger.error(f"Error calculating stats for dashboard: {str(e)}", 
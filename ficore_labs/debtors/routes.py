@@ -1,4 +1,4 @@
-from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify, Response, session
+from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify, Response, session, send_file
 from flask_login import login_required, current_user
 from flask_wtf import FlaskForm
 from wtforms import StringField, FloatField, TextAreaField, SubmitField
@@ -39,6 +39,17 @@ class DebtorForm(FlaskForm):
     description = TextAreaField(trans('debtors_description', default='Description of Transaction'), validators=[Optional()])
     submit = SubmitField(trans('debtors_add_debtor', default='Add Debtor'))
 
+# IOU fields as (translation key, default label, value getter), shared by the PDF and CSV exports
+IOU_FIELDS = (
+    ('debtors_debtor_name', 'Debtor', lambda d: d['name']),
+    ('debtors_amount_owed', 'Amount Owed', lambda d: utils.format_currency(d['amount_owed'])),
+    ('debtors_phone_number', 'Phone Number', lambda d: d['phone_number']),
+    ('debtors_email', 'Email', lambda d: d['email']),
+    ('debtors_description', 'Description of Transaction', lambda d: d['description']),
+    ('debtors_date_recorded', 'Date Recorded', lambda d: utils.format_date(d['created_at'])),
+    ('debtors_reminders_sent', 'Reminders Sent', lambda d: d.get('reminder_count', 0)),
+)
+
 debtors_bp = Blueprint('debtors', __name__, url_prefix='/debtors')
 
 @debtors_bp.route('/')
@@ -52,11 +63,14 @@ def index():
         debtors = list(db.records.find(query).sort('created_at', -1))
         
         # Convert naive datetimes to timezone-aware
+        utc = ZoneInfo("UTC")
         for debtor in debtors:
-            if debtor.get('created_at') and debtor['created_at'].tzinfo is None:
-                debtor['created_at'] = debtor['created_at'].replace(tzinfo=ZoneInfo("UTC"))
-            if debtor.get('reminder_date') and debtor['reminder_date'].tzinfo is None:
-                debtor['reminder_date'] = debtor['reminder_date'].replace(tzinfo=ZoneInfo("UTC"))
+            created_at = debtor.get('created_at')
+            if created_at and created_at.tzinfo is None:
+                debtor['created_at'] = created_at.replace(tzinfo=utc)
+            reminder_date = debtor.get('reminder_date')
+            if reminder_date and reminder_date.tzinfo is None:
+                debtor['reminder_date'] = reminder_date.replace(tzinfo=utc)
         
         can_interact = utils.can_user_interact(current_user)
         if not can_interact:
@@ -84,11 +98,14 @@ def manage():
         debtors = list(db.records.find(query).sort('created_at', -1))
         
         # Convert naive datetimes to timezone-aware
+        utc = ZoneInfo("UTC")
         for debtor in debtors:
-            if debtor.get('created_at') and debtor['created_at'].tzinfo is None:
-                debtor['created_at'] = debtor['created_at'].replace(tzinfo=ZoneInfo("UTC"))
-            if debtor.get('reminder_date') and debtor['reminder_date'].tzinfo is None:
-                debtor['reminder_date'] = debtor['reminder_date'].replace(tzinfo=ZoneInfo("UTC"))
+            created_at = debtor.get('created_at')
+            if created_at and created_at.tzinfo is None:
+                debtor['created_at'] = created_at.replace(tzinfo=utc)
+            reminder_date = debtor.get('reminder_date')
+            if reminder_date and reminder_date.tzinfo is None:
+                debtor['reminder_date'] = reminder_date.replace(tzinfo=utc)
         
         can_interact = utils.can_user_interact(current_user)
         if not can_interact:
@@ -318,7 +335,7 @@ def generate_iou(id):
         debtor['email'] = utils.sanitize_input(debtor.get('email', 'N/A'), max_length=100)
         
         buffer = io.BytesIO()
-        p = canvas.Canvas(buffer, pagesize=letter)
+        p = canvas.Canvas(buffer, pagesize=letter, pageCompression=1)
         draw_ficore_pdf_header(p, current_user, y_start=10.5 * inch)
         
         # Calculate the Y position for the title
@@ -329,21 +346,11 @@ def generate_iou(id):
         p.setFont("Helvetica-Bold", 24)
         p.drawString(inch, title_y * inch, trans('debtors_iou_title', default='FiCore Records - IOU'))
         
-        p.setFont("Helvetica", 12)
-        y_position = title_y - 0.5
-        p.drawString(inch, y_position * inch, f"{trans('debtors_debtor_name', default='Debtor')}: {debtor['name']}")
-        y_position -= 0.3
-        p.drawString(inch, y_position * inch, f"{trans('debtors_amount_owed', default='Amount Owed')}: {utils.format_currency(debtor['amount_owed'])}")
-        y_position -= 0.3
-        p.drawString(inch, y_position * inch, f"{trans('debtors_phone_number', default='Phone Number')}: {debtor['phone_number']}")
-        y_position -= 0.3
-        p.drawString(inch, y_position * inch, f"{trans('debtors_email', default='Email')}: {debtor['email']}")
-        y_position -= 0.3
-        p.drawString(inch, y_position * inch, f"{trans('debtors_description', default='Description of Transaction')}: {debtor['description']}")
-        y_position -= 0.3
-        p.drawString(inch, y_position * inch, f"{trans('debtors_date_recorded', default='Date Recorded')}: {utils.format_date(debtor['created_at'])}")
-        y_position -= 0.3
-        p.drawString(inch, y_position * inch, f"{trans('debtors_reminders_sent', default='Reminders Sent')}: {debtor.get('reminder_count', 0)}")
+        text = p.beginText(inch, (title_y - 0.5) * inch)
+        text.setFont("Helvetica", 12, leading=0.3 * inch)
+        for key, default, value in IOU_FIELDS:
+            text.textLine(f"{trans(key, default=default)}: {value(debtor)}")
+        p.drawText(text)
         
         p.setFont("Helvetica-Oblique", 10)
         p.drawString(inch, inch, trans('debtors_iou_footer', default='This document serves as an IOU recorded on FiCore Records.'))
@@ -352,12 +359,11 @@ def generate_iou(id):
         p.save()
         
         buffer.seek(0)
-        return Response(
-            buffer.getvalue(),
+        return send_file(
+            buffer,
             mimetype='application/pdf',
-            headers={
-                'Content-Disposition': f'attachment; filename=FiCore_IOU_{utils.sanitize_input(debtor["name"], max_length=50)}.pdf'
-            }
+            as_attachment=True,
+            download_name=f'FiCore_IOU_{debtor["name"][:50]}.pdf'
         )
         
     except ValueError:
@@ -403,13 +409,7 @@ def generate_iou_csv(id):
         output.extend(ficore_csv_header(current_user))
         output.append([trans('debtors_iou_title', default='FiCore Records - IOU')])
         output.append([''])
-        output.append([trans('debtors_debtor_name', default='Debtor'), debtor['name']])
-        output.append([trans('debtors_amount_owed', default='Amount Owed'), utils.format_currency(debtor['amount_owed'])])
-        output.append([trans('debtors_phone_number', default='Phone Number'), debtor['phone_number']])
-        output.append([trans('debtors_email', default='Email'), debtor['email']])
-        output.append([trans('debtors_description', default='Description of Transaction'), debtor['description']])
-        output.append([trans('debtors_date_recorded', default='Date Recorded'), utils.format_date(debtor['created_at'])])
-        output.append([trans('debtors_reminders_sent', default='Reminders Sent'), debtor.get('reminder_count', 0)])
+        output.extend([trans(key, default=default), value(debtor)] for key, default, value in IOU_FIELDS)
         output.append([''])
         output.append([trans('debtors_iou_footer', default='This document serves as an IOU recorded on FiCore Records.')])
         
@@ -422,7 +422,7 @@ def generate_iou_csv(id):
             buffer,
             mimetype='text/csv',
             headers={
-                'Content-Disposition': f'attachment; filename=FiCore_IOU_{utils.sanitize_input(debtor["name"], max_length=50)}.csv'
+                'Content-Disposition': f'attachment; filename=FiCore_IOU_{debtor["name"][:50]}.csv'
             }
         )
         
@@ -559,10 +559,6 @@ def delete(id):
         
         db = utils.get_mongo_db()
         query = {'_id': ObjectId(id), 'user_id': str(current_user.id), 'type': 'debtor'}
-        debtor = db.records.find_one(query)
-        if not debtor:
-            flash(trans('debtors_record_not_found', default='Record not found'), 'danger')
-            return redirect(url_for('debtors.index'))
         result = db.records.delete_one(query)
         if result.deleted_count:
             flash(trans('debtors_delete_success', default='Debtor deleted successfully'), 'success')
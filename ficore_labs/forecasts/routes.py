@@ -1,4 +1,4 @@
-from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify, Response, session
+from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify, Response, session, send_file
 from flask_login import login_required, current_user
 from flask_wtf import FlaskForm
 from wtforms import StringField, FloatField, TextAreaField, SubmitField, DateField
@@ -26,6 +26,17 @@ class ForecastForm(FlaskForm):
     description = TextAreaField(trans('general_description', default='Description'), validators=[Optional()])
     submit = SubmitField(trans('forecasts_add_forecast', default='Add Forecast'))
 
+# Forecast summary fields as (translation key, default label, value getter), shared by the PDF and CSV exports
+FORECAST_SUMMARY_FIELDS = (
+    ('forecasts_title', 'Title', lambda f: f['title']),
+    ('forecasts_projected_revenue', 'Projected Revenue', lambda f: utils.format_currency(f['projected_revenue'])),
+    ('forecasts_projected_expenses', 'Projected Expenses', lambda f: utils.format_currency(f['projected_expenses'])),
+    ('forecasts_net_profit', 'Net Profit', lambda f: utils.format_currency(f['projected_revenue'] - f['projected_expenses'])),
+    ('forecasts_date', 'Forecast Date', lambda f: utils.format_date(f['forecast_date'])),
+    ('general_description', 'Description', lambda f: f.get('description', 'No description provided')),
+    ('forecasts_date_recorded', 'Date Recorded', lambda f: utils.format_date(f['created_at'])),
+)
+
 forecasts_bp = Blueprint('forecasts', __name__, url_prefix='/forecasts')
 
 @forecasts_bp.route('/')
@@ -170,7 +181,7 @@ def generate_report(id):
             forecast['created_at'] = forecast['created_at'].replace(tzinfo=ZoneInfo("UTC"))
         
         buffer = io.BytesIO()
-        p = canvas.Canvas(buffer, pagesize=letter)
+        p = canvas.Canvas(buffer, pagesize=letter, pageCompression=1)
         draw_ficore_pdf_header(p, current_user, y_start=10.5)
         
         header_height = 0.7
@@ -180,21 +191,11 @@ def generate_report(id):
         p.setFont("Helvetica-Bold", 24)
         p.drawString(inch, title_y * inch, trans('forecasts_report_title', default='FiCore Records - Forecast Report'))
         
-        p.setFont("Helvetica", 12)
-        y_position = title_y - 0.5
-        p.drawString(inch, y_position * inch, f"{trans('forecasts_title', default='Title')}: {forecast['title']}")
-        y_position -= 0.3
-        p.drawString(inch, y_position * inch, f"{trans('forecasts_projected_revenue', default='Projected Revenue')}: {utils.format_currency(forecast['projected_revenue'])}")
-        y_position -= 0.3
-        p.drawString(inch, y_position * inch, f"{trans('forecasts_projected_expenses', default='Projected Expenses')}: {utils.format_currency(forecast['projected_expenses'])}")
-        y_position -= 0.3
-        p.drawString(inch, y_position * inch, f"{trans('forecasts_net_profit', default='Net Profit')}: {utils.format_currency(forecast['projected_revenue'] - forecast['projected_expenses'])}")
-        y_position -= 0.3
-        p.drawString(inch, y_position * inch, f"{trans('forecasts_date', default='Forecast Date')}: {utils.format_date(forecast['forecast_date'])}")
-        y_position -= 0.3
-        p.drawString(inch, y_position * inch, f"{trans('general_description', default='Description')}: {forecast.get('description', 'No description provided')}")
-        y_position -= 0.3
-        p.drawString(inch, y_position * inch, f"{trans('forecasts_date_recorded', default='Date Recorded')}: {utils.format_date(forecast['created_at'])}")
+        text = p.beginText(inch, (title_y - 0.5) * inch)
+        text.setFont("Helvetica", 12, leading=0.3 * inch)
+        for key, default, value in FORECAST_SUMMARY_FIELDS:
+            text.textLine(f"{trans(key, default=default)}: {value(forecast)}")
+        p.drawText(text)
         
         p.setFont("Helvetica-Oblique", 10)
         p.drawString(inch, inch, trans('forecasts_report_footer', default='This document serves as a financial forecast recorded on FiCore Records.'))
@@ -203,12 +204,11 @@ def generate_report(id):
         p.save()
         
         buffer.seek(0)
-        return Response(
-            buffer.getvalue(),
+        return send_file(
+            buffer,
             mimetype='application/pdf',
-            headers={
-                'Content-Disposition': f'attachment; filename=FiCore_Forecast_Report_{forecast["title"]}.pdf'
-            }
+            as_attachment=True,
+            download_name=f'FiCore_Forecast_Report_{forecast["title"]}.pdf'
         )
         
     except Exception as e:
@@ -244,13 +244,7 @@ def generate_report_csv(id):
         output.extend(ficore_csv_header(current_user))
         output.append([trans('forecasts_report_title', default='FiCore Records - Forecast Report')])
         output.append([''])
-        output.append([trans('forecasts_title', default='Title'), forecast['title']])
-        output.append([trans('forecasts_projected_revenue', default='Projected Revenue'), utils.format_currency(forecast['projected_revenue'])])
-        output.append([trans('forecasts_projected_expenses', default='Projected Expenses'), utils.format_currency(forecast['projected_expenses'])])
-        output.append([trans('forecasts_net_profit', default='Net Profit'), utils.format_currency(forecast['projected_revenue'] - forecast['projected_expenses'])])
-        output.append([trans('forecasts_date', default='Forecast Date'), utils.format_date(forecast['forecast_date'])])
-        output.append([trans('general_description', default='Description'), forecast.get('description', 'No description provided')])
-        output.append([trans('forecasts_date_recorded', default='Date Recorded'), utils.format_date(forecast['created_at'])])
+        output.extend([trans(key, default=default), value(forecast)] for key, default, value in FORECAST_SUMMARY_FIELDS)
         output.append([''])
         output.append([trans('forecasts_report_footer', default='This document serves as a financial forecast recorded on FiCore Records.')])
         
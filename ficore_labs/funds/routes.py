@@ -1,4 +1,4 @@
-from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify, Response, session
+from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify, Response, session, send_file
 from flask_login import login_required, current_user
 from flask_wtf import FlaskForm
 from wtforms import StringField, FloatField, TextAreaField, SubmitField, SelectField
@@ -38,6 +38,15 @@ class FundForm(FlaskForm):
     description = TextAreaField(trans('general_description', default='Description'), validators=[Optional()])
     submit = SubmitField(trans('funds_add_fund', default='Add Fund'))
 
+# Fund summary fields as (translation key, default label, value getter), shared by the PDF and CSV exports
+FUND_SUMMARY_FIELDS = (
+    ('funds_source', 'Source', lambda f: f['source']),
+    ('funds_amount', 'Amount', lambda f: utils.format_currency(f['amount'])),
+    ('funds_category', 'Category', lambda f: trans(f'funds_{f["category"]}', default=f['category'].capitalize())),
+    ('general_description', 'Description', lambda f: f['description']),
+    ('funds_date_recorded', 'Date Recorded', lambda f: utils.format_date(f['created_at'])),
+)
+
 funds_bp = Blueprint('funds', __name__, url_prefix='/funds')
 
 @funds_bp.route('/')
@@ -50,9 +59,11 @@ def index():
         query = {'user_id': str(current_user.id), 'type': 'fund'}
         funds = list(db.records.find(query).sort('created_at', -1))
         
+        utc = ZoneInfo("UTC")
         for fund in funds:
-            if fund.get('created_at') and fund['created_at'].tzinfo is None:
-                fund['created_at'] = fund['created_at'].replace(tzinfo=ZoneInfo("UTC"))
+            created_at = fund.get('created_at')
+            if created_at and created_at.tzinfo is None:
+                fund['created_at'] = created_at.replace(tzinfo=utc)
         
         can_interact = utils.can_user_interact(current_user)
         
@@ -77,9 +88,11 @@ def manage():
         query = {'user_id': str(current_user.id), 'type': 'fund'}
         funds = list(db.records.find(query).sort('created_at', -1))
         
+        utc = ZoneInfo("UTC")
         for fund in funds:
-            if fund.get('created_at') and fund['created_at'].tzinfo is None:
-                fund['created_at'] = fund['created_at'].replace(tzinfo=ZoneInfo("UTC"))
+            created_at = fund.get('created_at')
+            if created_at and created_at.tzinfo is None:
+                fund['created_at'] = created_at.replace(tzinfo=utc)
         
         can_interact = utils.can_user_interact(current_user)
         
@@ -176,10 +189,9 @@ def generate_report(id):
         
         fund['source'] = utils.sanitize_input(fund['source'], max_length=100)
         fund['description'] = utils.sanitize_input(fund.get('description', 'No description provided'), max_length=500)
-        category = trans(f'funds_{fund["category"]}', default=fund['category'].capitalize())
         
         buffer = io.BytesIO()
-        p = canvas.Canvas(buffer, pagesize=letter)
+        p = canvas.Canvas(buffer, pagesize=letter, pageCompression=1)
         draw_ficore_pdf_header(p, current_user, y_start=10.5 * inch)
         
         header_height = 0.7
@@ -189,17 +201,11 @@ def generate_report(id):
         p.setFont("Helvetica-Bold", 24)
         p.drawString(inch, title_y * inch, trans('funds_summary_title', default='FiCore Records - Fund Summary'))  # Updated title
         
-        p.setFont("Helvetica", 12)
-        y_position = title_y - 0.5
-        p.drawString(inch, y_position * inch, f"{trans('funds_source', default='Source')}: {fund['source']}")
-        y_position -= 0.3
-        p.drawString(inch, y_position * inch, f"{trans('funds_amount', default='Amount')}: {utils.format_currency(fund['amount'])}")
-        y_position -= 0.3
-        p.drawString(inch, y_position * inch, f"{trans('funds_category', default='Category')}: {category}")
-        y_position -= 0.3
-        p.drawString(inch, y_position * inch, f"{trans('general_description', default='Description')}: {fund['description']}")
-        y_position -= 0.3
-        p.drawString(inch, y_position * inch, f"{trans('funds_date_recorded', default='Date Recorded')}: {utils.format_date(fund['created_at'])}")
+        text = p.beginText(inch, (title_y - 0.5) * inch)
+        text.setFont("Helvetica", 12, leading=0.3 * inch)
+        for key, default, value in FUND_SUMMARY_FIELDS:
+            text.textLine(f"{trans(key, default=default)}: {value(fund)}")
+        p.drawText(text)
         
         p.setFont("Helvetica-Oblique", 10)
         p.drawString(inch, inch, trans('funds_summary_footer', default='This document summarizes a fund recorded on FiCore Records.'))  # Updated footer
@@ -208,12 +214,11 @@ def generate_report(id):
         p.save()
         
         buffer.seek(0)
-        return Response(
-            buffer.getvalue(),
+        return send_file(
+            buffer,
             mimetype='application/pdf',
-            headers={
-                'Content-Disposition': f'attachment; filename=FiCore_Fund_Summary_{utils.sanitize_input(fund["source"], max_length=50)}.pdf'  # Updated filename
-            }
+            as_attachment=True,
+            download_name=f'FiCore_Fund_Summary_{fund["source"][:50]}.pdf'  # Updated filename
         )
         
     except ValueError:
@@ -248,17 +253,12 @@ def generate_report_csv(id):
         
         fund['source'] = utils.sanitize_input(fund['source'], max_length=100)
         fund['description'] = utils.sanitize_input(fund.get('description', 'No description provided'), max_length=500)
-        category = trans(f'funds_{fund["category"]}', default=fund['category'].capitalize())
         
         output = []
         output.extend(ficore_csv_header(current_user))
         output.append([trans('funds_summary_title', default='FiCore Records - Fund Summary')])  # Updated title
         output.append([''])
-        output.append([trans('funds_source', default='Source'), fund['source']])
-        output.append([trans('funds_amount', default='Amount'), utils.format_currency(fund['amount'])])
-        output.append([trans('funds_category', default='Category'), category])
-        output.append([trans('general_description', default='Description'), fund['description']])
-        output.append([trans('funds_date_recorded', default='Date Recorded'), utils.format_date(fund['created_at'])])
+        output.extend([trans(key, default=default), value(fund)] for key, default, value in FUND_SUMMARY_FIELDS)
         output.append([''])
         output.append([trans('funds_summary_footer', default='This document summarizes a fund recorded on FiCore Records.')])  # Updated footer
         
@@ -271,7 +271,7 @@ def generate_report_csv(id):
             buffer,
             mimetype='text/csv',
             headers={
-                'Content-Disposition': f'attachment; filename=FiCore_Fund_Summary_{utils.sanitize_input(fund["source"], max_length=50)}.csv'  # Updated filename
+                'Content-Disposition': f'attachment; filename=FiCore_Fund_Summary_{fund["source"][:50]}.csv'  # Updated filename
             }
         )
         
@@ -10,6 +10,7 @@ from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 from models import create_feedback, get_mongo_db, get_user, create_waitlist_entry, get_waitlist_entries
 from flask import current_app
+from pymongo import InsertOne
 import utils
 from users.routes import get_post_login_redirect
 
@@ -283,28 +284,27 @@ def feedback():
                     flash(trans('general_subscription_required', default='Your trial has expired. Please subscribe to submit feedback.'), 'warning')
                     return redirect(url_for('subscribe_bp.subscribe'))
             
-            with current_app.app_context():
-                db = get_mongo_db()
-                feedback_entry = {
+            db = get_mongo_db()
+            feedback_entry = {
+                'user_id': str(current_user.id) if current_user.is_authenticated else None,
+                'session_id': session.get('sid', 'no-session-id'),
+                'tool_name': tool_name,
+                'rating': int(rating),
+                'comment': comment or None,
+                'timestamp': datetime.now(timezone.utc)
+            }
+            create_feedback(db, feedback_entry)
+            
+            utils.queue_write('audit_logs', InsertOne({
+                'admin_id': 'system',
+                'action': 'submit_feedback',
+                'details': {
                     'user_id': str(current_user.id) if current_user.is_authenticated else None,
-                    'session_id': session.get('sid', 'no-session-id'),
                     'tool_name': tool_name,
-                    'rating': int(rating),
-                    'comment': comment or None,
-                    'timestamp': datetime.now(timezone.utc)
-                }
-                create_feedback(db, feedback_entry)
-                
-                db.audit_logs.insert_one({
-                    'admin_id': 'system',
-                    'action': 'submit_feedback',
-                    'details': {
-                        'user_id': str(current_user.id) if current_user.is_authenticated else None,
-                        'tool_name': tool_name,
-                        'rating': int(rating)
-                    },
-                    'timestamp': datetime.now(timezone.utc)
-                })
+                    'rating': int(rating)
+                },
+                'timestamp': datetime.now(timezone.utc)
+            }))
             
             current_app.logger.info(
                 f'Feedback submitted: tool={tool_name}, rating={rating}',
@@ -379,31 +379,30 @@ def waitlist():
                         return render_template('general/waitlist.html', title=trans('general_waitlist', lang=lang, default='Join Our Waitlist'), form=form)
 
                 # Store waitlist entry
-                with current_app.app_context():
-                    db = get_mongo_db()
-                    waitlist_entry = {
+                db = get_mongo_db()
+                waitlist_entry = {
+                    'full_name': full_name,
+                    'whatsapp_number': whatsapp_number,
+                    'email': email,
+                    'business_type': business_type,
+                    'created_at': datetime.now(timezone.utc),
+                    'updated_at': datetime.now(timezone.utc),
+                    'session_id': session.get('sid', 'no-session-id'),
+                    'user_id': str(current_user.id) if current_user.is_authenticated else None
+                }
+                create_waitlist_entry(db, waitlist_entry)
+                
+                # Log audit entry
+                utils.queue_write('audit_logs', InsertOne({
+                    'admin_id': 'system',
+                    'action': 'submit_waitlist',
+                    'details': {
+                        'user_id': str(current_user.id) if current_user.is_authenticated else None,
                         'full_name': full_name,
-                        'whatsapp_number': whatsapp_number,
-                        'email': email,
-                        'business_type': business_type,
-                        'created_at': datetime.now(timezone.utc),
-                        'updated_at': datetime.now(timezone.utc),
-                        'session_id': session.get('sid', 'no-session-id'),
-                        'user_id': str(current_user.id) if current_user.is_authenticated else None
-                    }
-                    create_waitlist_entry(db, waitlist_entry)
-                    
-                    # Log audit entry
-                    db.audit_logs.insert_one({
-                        'admin_id': 'system',
-                        'action': 'submit_waitlist',
-                        'details': {
-                            'user_id': str(current_user.id) if current_user.is_authenticated else None,
-                            'full_name': full_name,
-                            'email': email
-                        },
-                        'timestamp': datetime.now(timezone.utc)
-                    })
+                        'email': email
+                    },
+                    'timestamp': datetime.now(timezone.utc)
+                }))
                 
                 current_app.logger.info(
                     f'Waitlist entry submitted: name={full_name}, email={email}',
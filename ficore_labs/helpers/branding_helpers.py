@@ -1,3 +1,4 @@
+from functools import lru_cache
 from flask import current_app
 from reportlab.lib.utils import ImageReader
 from reportlab.lib import colors
@@ -12,10 +13,43 @@ TOP_MARGIN = 10.5  # in inches, adjusted to match new y_start
 FICORE_MARKETING = "Empowering Africa's Businesses and Households. Contact: FicoreAfrica@gmail.com  | +234-xxx-xxxx"
 FICORE_BRAND = "Ficore Africa"
 
-def draw_ficore_pdf_header(canvas, user, y_start=10.5):
+@lru_cache(maxsize=4)
+def get_logo_reader(logo_path):
+    """
+    Return a shared ImageReader for the logo so its PNG is decoded once per process, not once per page.
+    """
+    return ImageReader(logo_path)
+
+def ficore_user_line(user):
+    """
+    Return the "Username: ... | Email: ..." line shown in PDF and CSV headers (display_name > _id > username).
+    """
+    user_display = getattr(user, "display_name", "") or getattr(user, "_id", "") or getattr(user, "username", "User")
+    user_email = getattr(user, "email", "")
+    return f"Username: {user_display} | Email: {user_email}"
+
+def draw_ficore_pdf_header(canvas, user, y_start=10.5, user_line=None):
     """
     Draw Ficore branding and user info at the top of a PDF page with a shaded background and separator line.
+    Multi-page exports can pass a precomputed user_line so the user is only read once per document.
+    The header is recorded once per document as a form XObject and stamped onto later pages.
     """
+    form_name = f"ficoreHeader{int(y_start * 100)}"
+    if not canvas.hasForm(form_name):
+        if user_line is None:
+            user_line = ficore_user_line(user)
+        canvas.beginForm(form_name)
+        _draw_ficore_pdf_header_contents(canvas, y_start, user_line)
+        canvas.endForm()
+    canvas.doForm(form_name)
+
+    # Leave the canvas in the state the inline header used to, as callers draw straight after it
+    canvas.setFont("Helvetica", 9)
+    canvas.setFillColor(FICORE_TEXT_COLOR)
+    canvas.setStrokeColor(colors.black)
+    canvas.setLineWidth(1)
+
+def _draw_ficore_pdf_header_contents(canvas, y_start, user_line):
     inch = 72  # 1 inch in points
     static_folder = current_app.static_folder
     logo_path = f"{static_folder}/{FICORE_LOGO_PATH}"
@@ -44,7 +78,7 @@ def draw_ficore_pdf_header(canvas, user, y_start=10.5):
 
     # Draw logo
     try:
-        logo = ImageReader(logo_path)
+        logo = get_logo_reader(logo_path)
         canvas.drawImage(logo, 1 * inch, y_logo * inch, width=0.5 * inch, height=0.5 * inch, mask='auto')
     except Exception:
         pass  # Don't break PDF if logo fails
@@ -59,12 +93,10 @@ def draw_ficore_pdf_header(canvas, user, y_start=10.5):
     canvas.setFillColor(colors.black)
     canvas.drawString(1.75 * inch, y_marketing * inch, FICORE_MARKETING)
 
-    # User info (display_name > _id > username)
-    user_display = getattr(user, "display_name", "") or getattr(user, "_id", "") or getattr(user, "username", "User")
-    user_email = getattr(user, "email", "")
+    # User info
     canvas.setFont("Helvetica", 9)
     canvas.setFillColor(FICORE_TEXT_COLOR)
-    canvas.drawString(1 * inch, y_user * inch, f"Username: {user_display} | Email: {user_email}")
+    canvas.drawString(1 * inch, y_user * inch, user_line)
 
     # Red separator line below header content
     canvas.setStrokeColor(colors.red)
@@ -76,11 +108,9 @@ def ficore_csv_header(user):
     """
     Return a list of rows (each is a list of str) for branding/user info for CSV.
     """
-    user_display = getattr(user, "display_name", "") or getattr(user, "_id", "") or getattr(user, "username", "User")
-    user_email = getattr(user, "email", "")
     return [
         [FICORE_BRAND],
         [FICORE_MARKETING],
-        [f"Username: {user_display} | Email: {user_email}"],
+        [ficore_user_line(user)],
         []
     ]
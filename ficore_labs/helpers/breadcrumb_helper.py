@@ -4,11 +4,166 @@ Breadcrumb navigation helper for generating breadcrumb data based on current rou
 
 from flask import request, url_for
 from flask_login import current_user
-from werkzeug.routing import BuildError
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Breadcrumb trail per endpoint: (label, label_key, link endpoint or None for the current page, icon).
+# Kept as static data so only the current endpoint's links are resolved per request.
+BREADCRUMB_SPECS = {
+    # Debtors module
+    'debtors.index': (
+        ('Debtors', 'debtors_dashboard', None, 'bi-person-plus'),
+    ),
+    'debtors.add': (
+        ('Debtors', 'debtors_dashboard', 'debtors.index', 'bi-person-plus'),
+        ('Add Debtor', 'debtors_add_debtor', None, 'bi-plus-circle'),
+    ),
+    'debtors.edit': (
+        ('Debtors', 'debtors_dashboard', 'debtors.index', 'bi-person-plus'),
+        ('Edit Debtor', 'debtors_edit_debtor', None, 'bi-pencil-square'),
+    ),
+
+    # Creditors module
+    'creditors.index': (
+        ('Creditors', 'creditors_dashboard', None, 'bi-arrow-up-circle'),
+    ),
+    'creditors.add': (
+        ('Creditors', 'creditors_dashboard', 'creditors.index', 'bi-arrow-up-circle'),
+        ('Add Creditor', 'creditors_add_creditor', None, 'bi-plus-circle'),
+    ),
+    'creditors.edit': (
+        ('Creditors', 'creditors_dashboard', 'creditors.index', 'bi-arrow-up-circle'),
+        ('Edit Creditor', 'creditors_edit_creditor', None, 'bi-pencil-square'),
+    ),
+
+    # Receipts module
+    'receipts.index': (
+        ('Receipts', 'receipts_dashboard', None, 'bi-cash-coin'),
+    ),
+    'receipts.add': (
+        ('Receipts', 'receipts_dashboard', 'receipts.index', 'bi-cash-coin'),
+        ('Add Receipt', 'receipts_add_receipt', None, 'bi-plus-circle'),
+    ),
+    'receipts.edit': (
+        ('Receipts', 'receipts_dashboard', 'receipts.index', 'bi-cash-coin'),
+        ('Edit Receipt', 'receipts_edit_receipt', None, 'bi-pencil-square'),
+    ),
+
+    # Payments module
+    'payments.index': (
+        ('Payments', 'payments_dashboard', None, 'bi-calculator'),
+    ),
+    'payments.add': (
+        ('Payments', 'payments_dashboard', 'payments.index', 'bi-calculator'),
+        ('Add Payment', 'payments_add_payment', None, 'bi-plus-circle'),
+    ),
+    'payments.edit': (
+        ('Payments', 'payments_dashboard', 'payments.index', 'bi-calculator'),
+        ('Edit Payment', 'payments_edit_payment', None, 'bi-pencil-square'),
+    ),
+
+    # Reports module
+    'reports.index': (
+        ('Reports', 'business_reports', None, 'bi-journal-minus'),
+    ),
+    'reports.generate': (
+        ('Reports', 'business_reports', 'reports.index', 'bi-journal-minus'),
+        ('Generate Report', 'reports_generate', None, 'bi-file-earmark-plus'),
+    ),
+
+    # Dashboard module
+    'dashboard.index': (
+        ('Dashboard', 'general_dashboard', None, 'bi-speedometer2'),
+    ),
+
+    # Funds module (for startup users)
+    'funds.index': (
+        ('Funds', 'funds_dashboard', None, 'bi-piggy-bank'),
+    ),
+    'funds.add': (
+        ('Funds', 'funds_dashboard', 'funds.index', 'bi-piggy-bank'),
+        ('Add Fund', 'funds_add_fund', None, 'bi-plus-circle'),
+    ),
+    'funds.edit': (
+        ('Funds', 'funds_dashboard', 'funds.index', 'bi-piggy-bank'),
+        ('Edit Fund', 'funds_edit_fund', None, 'bi-pencil-square'),
+    ),
+
+    # Forecasts module (for startup users)
+    'forecasts.index': (
+        ('Forecasts', 'forecasts_dashboard', None, 'bi-graph-up'),
+    ),
+    'forecasts.add': (
+        ('Forecasts', 'forecasts_dashboard', 'forecasts.index', 'bi-graph-up'),
+        ('Add Forecast', 'forecasts_add_forecast', None, 'bi-plus-circle'),
+    ),
+    'forecasts.edit': (
+        ('Forecasts', 'forecasts_dashboard', 'forecasts.index', 'bi-graph-up'),
+        ('Edit Forecast', 'forecasts_edit_forecast', None, 'bi-pencil-square'),
+    ),
+
+    # Investor Reports module (for startup users)
+    'investor_reports.index': (
+        ('Investor Reports', 'investor_reports_dashboard', None, 'bi-file-earmark-bar-graph'),
+    ),
+    'investor_reports.add': (
+        ('Investor Reports', 'investor_reports_dashboard', 'investor_reports.index', 'bi-file-earmark-bar-graph'),
+        ('Add Report', 'investor_reports_add_report', None, 'bi-plus-circle'),
+    ),
+    'investor_reports.edit': (
+        ('Investor Reports', 'investor_reports_dashboard', 'investor_reports.index', 'bi-file-earmark-bar-graph'),
+        ('Edit Report', 'investor_reports_edit_report', None, 'bi-pencil-square'),
+    ),
+
+    # KYC module
+    'kyc.index': (
+        ('KYC Verification', 'kyc_verification', None, 'bi-shield-check'),
+    ),
+    'kyc.upload': (
+        ('KYC Verification', 'kyc_verification', 'kyc.index', 'bi-shield-check'),
+        ('Upload Documents', 'kyc_upload_documents', None, 'bi-cloud-upload'),
+    ),
+
+    # Settings module
+    'settings.profile': (
+        ('Settings', 'settings_title', None, 'bi-gear'),
+        ('Profile', 'profile_settings', None, 'bi-person'),
+    ),
+    'settings.security': (
+        ('Settings', 'settings_title', 'settings.profile', 'bi-gear'),
+        ('Security', 'security_settings', None, 'bi-shield-lock'),
+    ),
+    'settings.business': (
+        ('Settings', 'settings_title', 'settings.profile', 'bi-gear'),
+        ('Business', 'business_settings', None, 'bi-building'),
+    ),
+
+    # Admin module
+    'admin.dashboard': (
+        ('Admin', 'admin_dashboard', None, 'bi-speedometer'),
+    ),
+    'admin.manage_users': (
+        ('Admin', 'admin_dashboard', 'admin.dashboard', 'bi-speedometer'),
+        ('Manage Users', 'admin_manage_users', None, 'bi-people'),
+    ),
+
+    # Business module
+    'business.view_data': (
+        ('Business Data', 'business_data', None, 'bi-bar-chart'),
+    ),
+
+    # Subscription module
+    'subscribe_bp.subscribe': (
+        ('Subscription', 'subscribe_title', None, 'bi-star'),
+    ),
+
+    # Notifications
+    'notifications.index': (
+        ('Notifications', 'general_notifications', None, 'bi-bell'),
+    ),
+}
+
 def get_breadcrumb_items():
     """
     Generate breadcrumb items based on the current route.
@@ -21,178 +176,14 @@ def get_breadcrumb_items():
 
         breadcrumb_items = []
         
-        # Define breadcrumb mappings for different routes
-        breadcrumb_map = {
-            # Debtors module
-            'debtors.index': [
-                {'label': 'Debtors', 'label_key': 'debtors_dashboard', 'icon': 'bi-person-plus'}
-            ],
-            'debtors.add': [
-                {'label': 'Debtors', 'label_key': 'debtors_dashboard', 'url': url_for('debtors.index'), 'icon': 'bi-person-plus'},
-                {'label': 'Add Debtor', 'label_key': 'debtors_add_debtor', 'icon': 'bi-plus-circle'}
-            ],
-            'debtors.edit': [
-                {'label': 'Debtors', 'label_key': 'debtors_dashboard', 'url': url_for('debtors.index'), 'icon': 'bi-person-plus'},
-                {'label': 'Edit Debtor', 'label_key': 'debtors_edit_debtor', 'icon': 'bi-pencil-square'}
-            ],
-            
-            # Creditors module
-            'creditors.index': [
-                {'label': 'Creditors', 'label_key': 'creditors_dashboard', 'icon': 'bi-arrow-up-circle'}
-            ],
-            'creditors.add': [
-                {'label': 'Creditors', 'label_key': 'creditors_dashboard', 'url': url_for('creditors.index'), 'icon': 'bi-arrow-up-circle'},
-                {'label': 'Add Creditor', 'label_key': 'creditors_add_creditor', 'icon': 'bi-plus-circle'}
-            ],
-            'creditors.edit': [
-                {'label': 'Creditors', 'label_key': 'creditors_dashboard', 'url': url_for('creditors.index'), 'icon': 'bi-arrow-up-circle'},
-                {'label': 'Edit Creditor', 'label_key': 'creditors_edit_creditor', 'icon': 'bi-pencil-square'}
-            ],
-            
-            # Receipts module
-            'receipts.index': [
-                {'label': 'Receipts', 'label_key': 'receipts_dashboard', 'icon': 'bi-cash-coin'}
-            ],
-            'receipts.add': [
-                {'label': 'Receipts', 'label_key': 'receipts_dashboard', 'url': url_for('receipts.index'), 'icon': 'bi-cash-coin'},
-                {'label': 'Add Receipt', 'label_key': 'receipts_add_receipt', 'icon': 'bi-plus-circle'}
-            ],
-            'receipts.edit': [
-                {'label': 'Receipts', 'label_key': 'receipts_dashboard', 'url': url_for('receipts.index'), 'icon': 'bi-cash-coin'},
-                {'label': 'Edit Receipt', 'label_key': 'receipts_edit_receipt', 'icon': 'bi-pencil-square'}
-            ],
-            
-            # Payments module
-            'payments.index': [
-                {'label': 'Payments', 'label_key': 'payments_dashboard', 'icon': 'bi-calculator'}
-            ],
-            'payments.add': [
-                {'label': 'Payments', 'label_key': 'payments_dashboard', 'url': url_for('payments.index'), 'icon': 'bi-calculator'},
-                {'label': 'Add Payment', 'label_key': 'payments_add_payment', 'icon': 'bi-plus-circle'}
-            ],
-            'payments.edit': [
-                {'label': 'Payments', 'label_key': 'payments_dashboard', 'url': url_for('payments.index'), 'icon': 'bi-calculator'},
-                {'label': 'Edit Payment', 'label_key': 'payments_edit_payment', 'icon': 'bi-pencil-square'}
-            ],
-            
-            # Reports module
-            'reports.index': [
-                {'label': 'Reports', 'label_key': 'business_reports', 'icon': 'bi-journal-minus'}
-            ],
-            'reports.generate': [
-                {'label': 'Reports', 'label_key': 'business_reports', 'url': url_for('reports.index'), 'icon': 'bi-journal-minus'},
-                {'label': 'Generate Report', 'label_key': 'reports_generate', 'icon': 'bi-file-earmark-plus'}
-            ],
-            
-            # Dashboard module
-            'dashboard.index': [
-                {'label': 'Dashboard', 'label_key': 'general_dashboard', 'icon': 'bi-speedometer2'}
-            ],
-            
-            # Funds module (for startup users)
-            'funds.index': [
-                {'label': 'Funds', 'label_key': 'funds_dashboard', 'icon': 'bi-piggy-bank'}
-            ],
-            'funds.add': [
-                {'label': 'Funds', 'label_key': 'funds_dashboard', 'url': url_for('funds.index'), 'icon': 'bi-piggy-bank'},
-                {'label': 'Add Fund', 'label_key': 'funds_add_fund', 'icon': 'bi-plus-circle'}
-            ],
-            'funds.edit': [
-                {'label': 'Funds', 'label_key': 'funds_dashboard', 'url': url_for('funds.index'), 'icon': 'bi-piggy-bank'},
-                {'label': 'Edit Fund', 'label_key': 'funds_edit_fund', 'icon': 'bi-pencil-square'}
-            ],
-            
-            # Forecasts module (for startup users)
-            'forecasts.index': [
-                {'label': 'Forecasts', 'label_key': 'forecasts_dashboard', 'icon': 'bi-graph-up'}
-            ],
-            'forecasts.add': [
-                {'label': 'Forecasts', 'label_key': 'forecasts_dashboard', 'url': url_for('forecasts.index'), 'icon': 'bi-graph-up'},
-                {'label': 'Add Forecast', 'label_key': 'forecasts_add_forecast', 'icon': 'bi-plus-circle'}
-            ],
-            'forecasts.edit': [
-                {'label': 'Forecasts', 'label_key': 'forecasts_dashboard', 'url': url_for('forecasts.index'), 'icon': 'bi-graph-up'},
-                {'label': 'Edit Forecast', 'label_key': 'forecasts_edit_forecast', 'icon': 'bi-pencil-square'}
-            ],
-            
-            # Investor Reports module (for startup users)
-            'investor_reports.index': [
-                {'label': 'Investor Reports', 'label_key': 'investor_reports_dashboard', 'icon': 'bi-file-earmark-bar-graph'}
-            ],
-            'investor_reports.add': [
-                {'label': 'Investor Reports', 'label_key': 'investor_reports_dashboard', 'url': url_for('investor_reports.index'), 'icon': 'bi-file-earmark-bar-graph'},
-                {'label': 'Add Report', 'label_key': 'investor_reports_add_report', 'icon': 'bi-plus-circle'}
-            ],
-            'investor_reports.edit': [
-                {'label': 'Investor Reports', 'label_key': 'investor_reports_dashboard', 'url': url_for('investor_reports.index'), 'icon': 'bi-file-earmark-bar-graph'},
-                {'label': 'Edit Report', 'label_key': 'investor_reports_edit_report', 'icon': 'bi-pencil-square'}
-            ],
-            
-            # KYC module
-            'kyc.index': [
-                {'label': 'KYC Verification', 'label_key': 'kyc_verification', 'icon': 'bi-shield-check'}
-            ],
-            'kyc.upload': [
-                {'label': 'KYC Verification', 'label_key': 'kyc_verification', 'url': url_for('kyc.index'), 'icon': 'bi-shield-check'},
-                {'label': 'Upload Documents', 'label_key': 'kyc_upload_documents', 'icon': 'bi-cloud-upload'}
-            ],
-            
-            # Settings module
-            'settings.profile': [
-                {'label': 'Settings', 'label_key': 'settings_title', 'icon': 'bi-gear'},
-                {'label': 'Profile', 'label_key': 'profile_settings', 'icon': 'bi-person'}
-            ],
-            'settings.security': [
-                {'label': 'Settings', 'label_key': 'settings_title', 'url': url_for('settings.profile'), 'icon': 'bi-gear'},
-                {'label': 'Security', 'label_key': 'security_settings', 'icon': 'bi-shield-lock'}
-            ],
-            'settings.business': [
-                {'label': 'Settings', 'label_key': 'settings_title', 'url': url_for('settings.profile'), 'icon': 'bi-gear'},
-                {'label': 'Business', 'label_key': 'business_settings', 'icon': 'bi-building'}
-            ],
-            
-            # Admin module
-            'admin.dashboard': [
-                {'label': 'Admin', 'label_key': 'admin_dashboard', 'icon': 'bi-speedometer'}
-            ],
-            'admin.manage_users': [
-                {'label': 'Admin', 'label_key': 'admin_dashboard', 'url': url_for('admin.dashboard'), 'icon': 'bi-speedometer'},
-                {'label': 'Manage Users', 'label_key': 'admin_manage_users', 'icon': 'bi-people'}
-            ],
-            
-            # Business module
-            'business.view_data': [
-                {'label': 'Business Data', 'label_key': 'business_data', 'icon': 'bi-bar-chart'}
-            ],
-            
-            # Subscription module
-            'subscribe_bp.subscribe': [
-                {'label': 'Subscription', 'label_key': 'subscribe_title', 'icon': 'bi-star'}
-            ],
-            
-            # Notifications
-            'notifications.index': [
-                {'label': 'Notifications', 'label_key': 'general_notifications', 'icon': 'bi-bell'}
-            ]
-        }
-        
         # Get breadcrumb items for current endpoint
-        if endpoint in breadcrumb_map:
-            breadcrumb_items = breadcrumb_map[endpoint].copy()
-            
-            # Add URLs for items that don't have them (current page items)
-            for item in breadcrumb_items:
-                if 'url' not in item:
-                    item['url'] = request.url
-                else:
-                    # Validate existing URLs
-                    try:
-                        # Test if the URL is valid by trying to build it
-                        if item['url'].startswith('url_for'):
-                            continue  # Skip validation for url_for calls
-                    except (BuildError, Exception):
-                        logger.warning(f"Invalid URL in breadcrumb item: {item}")
-                        item['url'] = '#'
+        for label, label_key, link_endpoint, icon in BREADCRUMB_SPECS.get(endpoint, ()):
+            breadcrumb_items.append({
+                'label': label,
+                'label_key': label_key,
+                'url': url_for(link_endpoint) if link_endpoint else request.url,
+                'icon': icon
+            })
         
         # Filter breadcrumbs based on user role if needed
         if current_user.is_authenticated:
@@ -1,4 +1,4 @@
-from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify, Response, session
+from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify, Response, session, send_file
 from flask_login import login_required, current_user
 from flask_wtf import FlaskForm
 from flask_wtf.csrf import CSRFError
@@ -36,6 +36,15 @@ class InvestorReportForm(FlaskForm):
     financial_highlights = TextAreaField(trans('investor_reports_financial_highlights', default='Financial Highlights'), validators=[Optional(), Length(max=1000)])
     submit = SubmitField(trans('investor_reports_add_report', default='Add Investor Report'))
 
+# Investor report fields as (translation key, default label, value getter), shared by the PDF and CSV exports
+INVESTOR_REPORT_FIELDS = (
+    ('investor_reports_title', 'Title', lambda r: r['title']),
+    ('investor_reports_date', 'Report Date', lambda r: utils.format_date(r['report_date'])),
+    ('investor_reports_summary', 'Summary', lambda r: r['summary']),
+    ('investor_reports_financial_highlights', 'Financial Highlights', lambda r: r['financial_highlights']),
+    ('investor_reports_date_recorded', 'Date Recorded', lambda r: utils.format_date(r['created_at'])),
+)
+
 investor_reports_bp = Blueprint('investor_reports', __name__, url_prefix='/investor_reports')
 
 @investor_reports_bp.route('/')
@@ -234,7 +243,7 @@ def generate_report(id):
         report['financial_highlights'] = utils.sanitize_input(report.get('financial_highlights', 'No highlights provided'), max_length=1000)
         
         buffer = io.BytesIO()
-        p = canvas.Canvas(buffer, pagesize=letter)
+        p = canvas.Canvas(buffer, pagesize=letter, pageCompression=1)
         draw_ficore_pdf_header(p, current_user, y_start=10.5 * inch)
         
         header_height = 0.7
@@ -244,17 +253,11 @@ def generate_report(id):
         p.setFont("Helvetica-Bold", 24)
         p.drawString(inch, title_y * inch, trans('investor_reports_report_title', default='FiCore Records - Investor Report'))
         
-        p.setFont("Helvetica", 12)
-        y_position = title_y - 0.5
-        p.drawString(inch, y_position * inch, f"{trans('investor_reports_title', default='Title')}: {report['title']}")
-        y_position -= 0.3
-        p.drawString(inch, y_position * inch, f"{trans('investor_reports_date', default='Report Date')}: {utils.format_date(report['report_date'])}")
-        y_position -= 0.3
-        p.drawString(inch, y_position * inch, f"{trans('investor_reports_summary', default='Summary')}: {report['summary']}")
-        y_position -= 0.3
-        p.drawString(inch, y_position * inch, f"{trans('investor_reports_financial_highlights', default='Financial Highlights')}: {report['financial_highlights']}")
-        y_position -= 0.3
-        p.drawString(inch, y_position * inch, f"{trans('investor_reports_date_recorded', default='Date Recorded')}: {utils.format_date(report['created_at'])}")
+        text = p.beginText(inch, (title_y - 0.5) * inch)
+        text.setFont("Helvetica", 12, leading=0.3 * inch)
+        for key, default, value in INVESTOR_REPORT_FIELDS:
+            text.textLine(f"{trans(key, default=default)}: {value(report)}")
+        p.drawText(text)
         
         p.setFont("Helvetica-Oblique", 10)
         p.drawString(inch, inch, trans('investor_reports_report_footer', default='This document serves as an investor report recorded on FiCore Records.'))
@@ -263,12 +266,11 @@ def generate_report(id):
         p.save()
         
         buffer.seek(0)
-        return Response(
-            buffer.getvalue(),
+        return send_file(
+            buffer,
             mimetype='application/pdf',
-            headers={
-                'Content-Disposition': f'attachment; filename=FiCore_Investor_Report_{utils.sanitize_input(report["title"], max_length=50)}.pdf'
-            }
+            as_attachment=True,
+            download_name=f'FiCore_Investor_Report_{report["title"][:50]}.pdf'
         )
         
     except Exception as e:
@@ -327,11 +329,7 @@ def generate_report_csv(id):
         output.extend(ficore_csv_header(current_user))
         output.append([trans('investor_reports_report_title', default='FiCore Records - Investor Report')])
         output.append([''])
-        output.append([trans('investor_reports_title', default='Title'), report['title']])
-        output.append([trans('investor_reports_date', default='Report Date'), utils.format_date(report['report_date'])])
-        output.append([trans('investor_reports_summary', default='Summary'), report['summary']])
-        output.append([trans('investor_reports_financial_highlights', default='Financial Highlights'), report['financial_highlights']])
-        output.append([trans('investor_reports_date_recorded', default='Date Recorded'), utils.format_date(report['created_at'])])
+        output.extend([trans(key, default=default), value(report)] for key, default, value in INVESTOR_REPORT_FIELDS)
         output.append([''])
         output.append([trans('investor_reports_report_footer', default='This document serves as an investor report recorded on FiCore Records.')])
         
@@ -344,7 +342,7 @@ def generate_report_csv(id):
             buffer,
             mimetype='text/csv',
             headers={
-                'Content-Disposition': f'attachment; filename=FiCore_Investor_Report_{utils.sanitize_input(report["title"], max_length=50)}.csv'
+                'Content-Disposition': f'attachment; filename=FiCore_Investor_Report_{report["title"][:50]}.csv'
             }
         )
         
@@ -827,9 +827,7 @@ def create_user(db, user_data):
             })
         }
         
-        with db.client.start_session() as session:
-            with session.start_transaction():
-                db.users.insert_one(user_doc, session=session)
+        db.users.insert_one(user_doc)
         
         logger.info(f"Created user with ID: {user_id} with 30-day trial", 
                    extra={'session_id': 'no-session-id'})
@@ -1,4 +1,4 @@
-from flask import Blueprint, render_template, redirect, url_for, flash, request, Response, jsonify, session
+from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify, session, send_file
 from flask_login import login_required, current_user
 from flask_wtf import FlaskForm
 from flask_wtf.csrf import CSRFError
@@ -33,6 +33,8 @@ class PaymentForm(FlaskForm):
 
 payments_bp = Blueprint('payments', __name__, url_prefix='/payments')
 
+SHARE_TYPES = frozenset(('sms', 'whatsapp'))
+
 @payments_bp.route('/')
 @login_required
 @utils.requires_role(['trader', 'startup', 'admin'])
@@ -44,9 +46,11 @@ def index():
         payments = list(db.cashflows.find(query).sort('created_at', -1))
         
         # Convert naive datetimes to timezone-aware
+        utc = ZoneInfo("UTC")
         for payment in payments:
-            if payment.get('created_at') and payment['created_at'].tzinfo is None:
-                payment['created_at'] = payment['created_at'].replace(tzinfo=ZoneInfo("UTC"))
+            created_at = payment.get('created_at')
+            if created_at and created_at.tzinfo is None:
+                payment['created_at'] = created_at.replace(tzinfo=utc)
         
         return render_template(
             'payments/index.html',
@@ -75,9 +79,11 @@ def manage():
         payments = list(db.cashflows.find(query).sort('created_at', -1))
         
         # Convert naive datetimes to timezone-aware
+        utc = ZoneInfo("UTC")
         for payment in payments:
-            if payment.get('created_at') and payment['created_at'].tzinfo is None:
-                payment['created_at'] = payment['created_at'].replace(tzinfo=ZoneInfo("UTC"))
+            created_at = payment.get('created_at')
+            if created_at and created_at.tzinfo is None:
+                payment['created_at'] = created_at.replace(tzinfo=utc)
         
         return render_template(
             'payments/manage.html',
@@ -155,40 +161,33 @@ def generate_pdf(id):
         payment['description'] = utils.sanitize_input(payment.get('description', ''), max_length=1000) if payment.get('description') else ''
         
         buffer = io.BytesIO()
-        p = canvas.Canvas(buffer, pagesize=letter)
-        width, height = letter
+        p = canvas.Canvas(buffer, pagesize=letter, pageCompression=1)
+        height = letter[1]
         p.setFont("Helvetica-Bold", 24)
         p.drawString(inch, height - inch, trans('payments_pdf_title', default='FiCore Records - Money Out Receipt'))
-        p.setFont("Helvetica", 12)
-        y_position = height - inch - 0.5 * inch
-        p.drawString(inch, y_position, f"{trans('payments_recipient_name', default='Recipient')}: {payment['party_name']}")
-        y_position -= 0.3 * inch
-        p.drawString(inch, y_position, f"{trans('payments_amount', default='Amount Paid')}: {utils.format_currency(payment['amount'])}")
-        y_position -= 0.3 * inch
-        p.drawString(inch, y_position, f"{trans('general_payment_method', default='Payment Method')}: {payment.get('method', 'N/A')}")
-        y_position -= 0.3 * inch
-        p.drawString(inch, y_position, f"{trans('general_category', default='Category')}: {payment['category']}")
-        y_position -= 0.3 * inch
-        p.drawString(inch, y_position, f"{trans('general_date', default='Date')}: {utils.format_date(payment['created_at'])}")
-        y_position -= 0.3 * inch
-        p.drawString(inch, y_position, f"{trans('payments_id', default='Payment ID')}: {str(payment['_id'])}")
-        y_position -= 0.3 * inch
+        text = p.beginText(inch, height - inch - 0.5 * inch)
+        text.setFont("Helvetica", 12, leading=0.3 * inch)
+        text.textLine(f"{trans('payments_recipient_name', default='Recipient')}: {payment['party_name']}")
+        text.textLine(f"{trans('payments_amount', default='Amount Paid')}: {utils.format_currency(payment['amount'])}")
+        text.textLine(f"{trans('general_payment_method', default='Payment Method')}: {payment.get('method', 'N/A')}")
+        text.textLine(f"{trans('general_category', default='Category')}: {payment['category']}")
+        text.textLine(f"{trans('general_date', default='Date')}: {utils.format_date(payment['created_at'])}")
+        text.textLine(f"{trans('payments_id', default='Payment ID')}: {str(payment['_id'])}")
         if payment['contact']:
-            p.drawString(inch, y_position, f"{trans('general_contact', default='Contact')}: {payment['contact']}")
-            y_position -= 0.3 * inch
+            text.textLine(f"{trans('general_contact', default='Contact')}: {payment['contact']}")
         if payment['description']:
-            p.drawString(inch, y_position, f"{trans('general_description', default='Description')}: {payment['description']}")
+            text.textLine(f"{trans('general_description', default='Description')}: {payment['description']}")
+        p.drawText(text)
         p.setFont("Helvetica-Oblique", 10)
         p.drawString(inch, inch, trans('payments_pdf_footer', default='This document serves as an official payment receipt generated by FiCore Records.'))
         p.showPage()
         p.save()
         buffer.seek(0)
-        return Response(
-            buffer.getvalue(),
+        return send_file(
+            buffer,
             mimetype='application/pdf',
-            headers={
-                'Content-Disposition': f'attachment; filename=payment_{utils.sanitize_input(payment["party_name"], max_length=50)}_{str(payment["_id"])}.pdf'
-            }
+            as_attachment=True,
+            download_name=f'payment_{payment["party_name"][:50]}_{str(payment["_id"])}.pdf'
         )
     except ValueError:
         logger.error(
@@ -441,8 +440,7 @@ def share():
                 'message': trans('payments_missing_fields', default='Missing required fields')
             }), 400
         
-        valid_share_types = ['sms', 'whatsapp']
-        if share_type not in valid_share_types:
+        if not isinstance(share_type, str) or share_type not in SHARE_TYPES:
             logger.error(
                 f"Invalid share type {share_type} in share payment request for user {current_user.id}",
                 extra={'session_id': session.get('sid', 'no-session-id'), 'user_id': current_user.id}
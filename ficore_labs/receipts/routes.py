@@ -1,4 +1,4 @@
-from flask import Blueprint, render_template, redirect, url_for, flash, request, Response, jsonify, session
+from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify, session, send_file
 from flask_login import login_required, current_user
 from flask_wtf import FlaskForm
 from flask_wtf.csrf import CSRFError
@@ -33,6 +33,8 @@ class ReceiptForm(FlaskForm):
 
 receipts_bp = Blueprint('receipts', __name__, url_prefix='/receipts')
 
+SHARE_TYPES = frozenset(('sms', 'whatsapp'))
+
 @receipts_bp.route('/')
 @login_required
 @utils.requires_role(['trader', 'startup', 'admin'])
@@ -44,9 +46,11 @@ def index():
         receipts = list(db.cashflows.find(query).sort('created_at', -1))
         
         # Convert naive datetimes to timezone-aware
+        utc = ZoneInfo("UTC")
         for receipt in receipts:
-            if receipt.get('created_at') and receipt['created_at'].tzinfo is None:
-                receipt['created_at'] = receipt['created_at'].replace(tzinfo=ZoneInfo("UTC"))
+            created_at = receipt.get('created_at')
+            if created_at and created_at.tzinfo is None:
+                receipt['created_at'] = created_at.replace(tzinfo=utc)
         
         logger.info(
             f"Fetched receipts for user {current_user.id}",
@@ -79,9 +83,11 @@ def manage():
         receipts = list(db.cashflows.find(query).sort('created_at', -1))
         
         # Convert naive datetimes to timezone-aware
+        utc = ZoneInfo("UTC")
         for receipt in receipts:
-            if receipt.get('created_at') and receipt['created_at'].tzinfo is None:
-                receipt['created_at'] = receipt['created_at'].replace(tzinfo=ZoneInfo("UTC"))
+            created_at = receipt.get('created_at')
+            if created_at and created_at.tzinfo is None:
+                receipt['created_at'] = created_at.replace(tzinfo=utc)
         
         logger.info(
             f"Fetched receipts for manage page for user {current_user.id}",
@@ -175,29 +181,23 @@ def generate_pdf(id):
         receipt['description'] = utils.sanitize_input(receipt.get('description', ''), max_length=1000) if receipt.get('description') else ''
         
         buffer = io.BytesIO()
-        p = canvas.Canvas(buffer, pagesize=letter)
-        width, height = letter
+        p = canvas.Canvas(buffer, pagesize=letter, pageCompression=1)
+        height = letter[1]
         p.setFont("Helvetica-Bold", 24)
         p.drawString(inch, height - inch, trans('receipts_pdf_title', default='FiCore Records - Money In Receipt'))
-        p.setFont("Helvetica", 12)
-        y_position = height - inch - 0.5 * inch
-        p.drawString(inch, y_position, f"{trans('receipts_party_name', default='Payer')}: {receipt['party_name']}")
-        y_position -= 0.3 * inch
-        p.drawString(inch, y_position, f"{trans('general_amount', default='Amount Received')}: {utils.format_currency(receipt['amount'])}")
-        y_position -= 0.3 * inch
-        p.drawString(inch, y_position, f"{trans('general_payment_method', default='Payment Method')}: {receipt.get('method', 'N/A')}")
-        y_position -= 0.3 * inch
-        p.drawString(inch, y_position, f"{trans('general_category', default='Category')}: {receipt['category']}")
-        y_position -= 0.3 * inch
-        p.drawString(inch, y_position, f"{trans('general_date', default='Date')}: {utils.format_date(receipt['created_at'])}")
-        y_position -= 0.3 * inch
-        p.drawString(inch, y_position, f"{trans('receipts_id', default='Receipt ID')}: {str(receipt['_id'])}")
-        y_position -= 0.3 * inch
+        text = p.beginText(inch, height - inch - 0.5 * inch)
+        text.setFont("Helvetica", 12, leading=0.3 * inch)
+        text.textLine(f"{trans('receipts_party_name', default='Payer')}: {receipt['party_name']}")
+        text.textLine(f"{trans('general_amount', default='Amount Received')}: {utils.format_currency(receipt['amount'])}")
+        text.textLine(f"{trans('general_payment_method', default='Payment Method')}: {receipt.get('method', 'N/A')}")
+        text.textLine(f"{trans('general_category', default='Category')}: {receipt['category']}")
+        text.textLine(f"{trans('general_date', default='Date')}: {utils.format_date(receipt['created_at'])}")
+        text.textLine(f"{trans('receipts_id', default='Receipt ID')}: {str(receipt['_id'])}")
         if receipt['contact']:
-            p.drawString(inch, y_position, f"{trans('general_contact', default='Contact')}: {receipt['contact']}")
-            y_position -= 0.3 * inch
+            text.textLine(f"{trans('general_contact', default='Contact')}: {receipt['contact']}")
         if receipt['description']:
-            p.drawString(inch, y_position, f"{trans('general_description', default='Description')}: {receipt['description']}")
+            text.textLine(f"{trans('general_description', default='Description')}: {receipt['description']}")
+        p.drawText(text)
         p.setFont("Helvetica-Oblique", 10)
         p.drawString(inch, inch, trans('receipts_pdf_footer', default='This document serves as an official receipt generated by FiCore Records.'))
         p.showPage()
@@ -207,12 +207,11 @@ def generate_pdf(id):
             f"Generated PDF for receipt {id} for user {current_user.id}",
             extra={'session_id': session.get('sid', 'no-session-id'), 'user_id': current_user.id}
         )
-        return Response(
-            buffer.getvalue(),
+        return send_file(
+            buffer,
             mimetype='application/pdf',
-            headers={
-                'Content-Disposition': f'attachment; filename=receipt_{utils.sanitize_input(receipt["party_name"], max_length=50)}_{str(receipt["_id"])}.pdf'
-            }
+            as_attachment=True,
+            download_name=f'receipt_{receipt["party_name"][:50]}_{str(receipt["_id"])}.pdf'
         )
     except ValueError:
         logger.error(
@@ -465,8 +464,7 @@ def share():
                 'message': trans('receipts_missing_fields', default='Missing required fields')
             }), 400
         
-        valid_share_types = ['sms', 'whatsapp']
-        if share_type not in valid_share_types:
+        if not isinstance(share_type, str) or share_type not in SHARE_TYPES:
             logger.error(
                 f"Invalid share type {share_type} in share receipt request for user {current_user.id}",
                 extra={'session_id': session.get('sid', 'no-session-id'), 'user_id': current_user.id}
@@ -1,4 +1,4 @@
-from flask import Blueprint, session, request, render_template, redirect, url_for, flash, jsonify, current_app, Response
+from flask import Blueprint, session, request, render_template, redirect, url_for, flash, jsonify, current_app, Response, send_file
 from flask_login import login_required, current_user
 from flask_wtf import FlaskForm
 from flask_wtf.csrf import CSRFError
@@ -16,7 +16,7 @@ from wtforms import DateField, StringField, SubmitField, SelectField
 from wtforms.validators import Optional, Length
 import csv
 import logging
-from helpers.branding_helpers import draw_ficore_pdf_header, ficore_csv_header
+from helpers.branding_helpers import draw_ficore_pdf_header, ficore_csv_header, ficore_user_line
 import pymongo.errors
 
 logger = logging.getLogger(__name__)
@@ -34,6 +34,13 @@ class CustomerReportForm(FlaskForm):
     format = SelectField('Format', choices=[('html', 'HTML'), ('pdf', 'PDF'), ('csv', 'CSV')], default='html', validators=[Optional()])
     submit = SubmitField('Generate Report')
 
+# Projections matching the fields read by the to_dict_* helpers below
+RECORD_REPORT_FIELDS = {'user_id': 1, 'type': 1, 'name': 1, 'contact': 1, 'amount_owed': 1, 'description': 1, 'created_at': 1, 'updated_at': 1}
+CASHFLOW_REPORT_FIELDS = {'user_id': 1, 'type': 1, 'party_name': 1, 'amount': 1, 'method': 1, 'created_at': 1, 'updated_at': 1}
+FUND_REPORT_FIELDS = {'user_id': 1, 'source': 1, 'amount': 1, 'date_received': 1, 'status': 1, 'created_at': 1, 'updated_at': 1}
+FORECAST_REPORT_FIELDS = {'user_id': 1, 'scenario': 1, 'projected_revenue': 1, 'projected_expenses': 1, 'period_start': 1, 'period_end': 1, 'created_at': 1, 'updated_at': 1}
+INVESTOR_REPORT_FIELDS = {'user_id': 1, 'title': 1, 'financial_metrics': 1, 'created_at': 1, 'updated_at': 1}
+
 def to_dict_record(record):
     if not record:
         return {'name': None, 'amount_owed': None}
@@ -241,7 +248,7 @@ def profit_loss():
             if form.end_date.data:
                 end_datetime = datetime.combine(form.end_date.data, datetime.max.time(), tzinfo=ZoneInfo("UTC"))
                 query['created_at'] = query.get('created_at', {}) | {'$lte': end_datetime}
-            cashflows = [to_dict_cashflow(cf) for cf in db.cashflows.find(query).sort('created_at', -1)]
+            cashflows = [to_dict_cashflow(cf) for cf in db.cashflows.find(query, CASHFLOW_REPORT_FIELDS).sort('created_at', -1)]
             output_format = form.format.data
             logger.info(
                 f"Generating profit/loss report for user {current_user.id}, format: {output_format}",
@@ -266,7 +273,7 @@ def profit_loss():
     else:
         try:
             db = utils.get_mongo_db()
-            cashflows = [to_dict_cashflow(cf) for cf in db.cashflows.find(query).sort('created_at', -1)]
+            cashflows = [to_dict_cashflow(cf) for cf in db.cashflows.find(query, CASHFLOW_REPORT_FIELDS).sort('created_at', -1)]
         except pymongo.errors.PyMongoError as e:
             logger.error(
                 f"MongoDB error fetching cashflows for user {current_user.id}: {str(e)}",
@@ -338,7 +345,7 @@ def debtors_creditors():
             if form.end_date.data:
                 end_datetime = datetime.combine(form.end_date.data, datetime.max.time(), tzinfo=ZoneInfo("UTC"))
                 query['created_at'] = query.get('created_at', {}) | {'$lte': end_datetime}
-            records = [to_dict_record(r) for r in db.records.find(query).sort('created_at', -1)]
+            records = [to_dict_record(r) for r in db.records.find(query, RECORD_REPORT_FIELDS).sort('created_at', -1)]
             output_format = form.format.data
             logger.info(
                 f"Generating debtors/creditors report for user {current_user.id}, format: {output_format}",
@@ -363,7 +370,7 @@ def debtors_creditors():
     else:
         try:
             db = utils.get_mongo_db()
-            records = [to_dict_record(r) for r in db.records.find(query).sort('created_at', -1)]
+            records = [to_dict_record(r) for r in db.records.find(query, RECORD_REPORT_FIELDS).sort('created_at', -1)]
         except pymongo.errors.PyMongoError as e:
             logger.error(
                 f"MongoDB error fetching records for user {current_user.id}: {str(e)}",
@@ -435,7 +442,7 @@ def funds():
             if form.end_date.data:
                 end_datetime = datetime.combine(form.end_date.data, datetime.max.time(), tzinfo=ZoneInfo("UTC"))
                 query['created_at'] = query.get('created_at', {}) | {'$lte': end_datetime}
-            funds = [to_dict_fund(f) for f in db.funds.find(query).sort('created_at', -1)]
+            funds = [to_dict_fund(f) for f in db.funds.find(query, FUND_REPORT_FIELDS).sort('created_at', -1)]
             output_format = form.format.data
             logger.info(
                 f"Generating funds report for user {current_user.id}, format: {output_format}",
@@ -460,7 +467,7 @@ def funds():
     else:
         try:
             db = utils.get_mongo_db()
-            funds = [to_dict_fund(f) for f in db.funds.find(query).sort('created_at', -1)]
+            funds = [to_dict_fund(f) for f in db.funds.find(query, FUND_REPORT_FIELDS).sort('created_at', -1)]
         except pymongo.errors.PyMongoError as e:
             logger.error(
                 f"MongoDB error fetching funds for user {current_user.id}: {str(e)}",
@@ -532,7 +539,7 @@ def forecasts():
             if form.end_date.data:
                 end_datetime = datetime.combine(form.end_date.data, datetime.max.time(), tzinfo=ZoneInfo("UTC"))
                 query['period_end'] = query.get('period_end', {}) | {'$lte': end_datetime}
-            forecasts = [to_dict_forecast(f) for f in db.forecasts.find(query).sort('created_at', -1)]
+            forecasts = [to_dict_forecast(f) for f in db.forecasts.find(query, FORECAST_REPORT_FIELDS).sort('created_at', -1)]
             output_format = form.format.data
             logger.info(
                 f"Generating forecasts report for user {current_user.id}, format: {output_format}",
@@ -557,7 +564,7 @@ def forecasts():
     else:
         try:
             db = utils.get_mongo_db()
-            forecasts = [to_dict_forecast(f) for f in db.forecasts.find(query).sort('created_at', -1)]
+            forecasts = [to_dict_forecast(f) for f in db.forecasts.find(query, FORECAST_REPORT_FIELDS).sort('created_at', -1)]
         except pymongo.errors.PyMongoError as e:
             logger.error(
                 f"MongoDB error fetching forecasts for user {current_user.id}: {str(e)}",
@@ -629,7 +636,7 @@ def investor_reports():
             if form.end_date.data:
                 end_datetime = datetime.combine(form.end_date.data, datetime.max.time(), tzinfo=ZoneInfo("UTC"))
                 query['created_at'] = query.get('created_at', {}) | {'$lte': end_datetime}
-            reports = [to_dict_investor_report(r) for r in db.investor_reports.find(query).sort('created_at', -1)]
+            reports = [to_dict_investor_report(r) for r in db.investor_reports.find(query, INVESTOR_REPORT_FIELDS).sort('created_at', -1)]
             output_format = form.format.data
             logger.info(
                 f"Generating investor reports for user {current_user.id}, format: {output_format}",
@@ -654,7 +661,7 @@ def investor_reports():
     else:
         try:
             db = utils.get_mongo_db()
-            reports = [to_dict_investor_report(r) for r in db.investor_reports.find(query).sort('created_at', -1)]
+            reports = [to_dict_investor_report(r) for r in db.investor_reports.find(query, INVESTOR_REPORT_FIELDS).sort('created_at', -1)]
         except pymongo.errors.PyMongoError as e:
             logger.error(
                 f"MongoDB error fetching investor reports for user {current_user.id}: {str(e)}",
@@ -752,7 +759,8 @@ def customer_reports():
                     'pipeline': [
                         {'$match': {'$expr': {'$eq': ['$user_id', '$$user_id']}}},
                         {'$sort': {'created_at': -1}},
-                        {'$limit': 1}
+                        {'$limit': 1},
+                        {'$project': FUND_REPORT_FIELDS}
                     ],
                     'as': 'latest_fund'
                 }},
@@ -762,7 +770,8 @@ def customer_reports():
                     'pipeline': [
                         {'$match': {'$expr': {'$eq': ['$user_id', '$$user_id']}}},
                         {'$sort': {'created_at': -1}},
-                        {'$limit': 1}
+                        {'$limit': 1},
+                        {'$project': FORECAST_REPORT_FIELDS}
                     ],
                     'as': 'latest_forecast'
                 }}
@@ -826,9 +835,96 @@ def customer_reports():
         flash(trans('reports_csrf_error', default='Invalid CSRF token. Please try again.'), 'danger')
         return render_template('reports/customer_reports_form.html', form=form, title='Generate Customer Report', can_interact=can_interact), 400
 
+# Report table columns as (x position in inches, translation key, default label)
+PROFIT_LOSS_COLUMNS = (
+    (1, 'general_date', 'Date'),
+    (2.5, 'general_party_name', 'Party Name'),
+    (4, 'general_type', 'Type'),
+    (5, 'general_amount', 'Amount')
+)
+DEBTORS_CREDITORS_COLUMNS = (
+    (1, 'general_date', 'Date'),
+    (2.5, 'general_name', 'Name'),
+    (4, 'general_type', 'Type'),
+    (5, 'general_amount_owed', 'Amount Owed'),
+    (6.5, 'general_description', 'Description')
+)
+FUNDS_COLUMNS = (
+    (1, 'general_date', 'Date'),
+    (2.5, 'funds_source', 'Source'),
+    (4, 'general_amount', 'Amount'),
+    (5, 'general_status', 'Status')
+)
+FORECASTS_COLUMNS = (
+    (1, 'general_date', 'Date'),
+    (2, 'forecasts_scenario', 'Scenario'),
+    (3.5, 'forecasts_projected_revenue', 'Projected Revenue'),
+    (4.5, 'forecasts_projected_expenses', 'Projected Expenses'),
+    (5.5, 'forecasts_period', 'Period')
+)
+INVESTOR_REPORTS_COLUMNS = (
+    (1, 'general_date', 'Date'),
+    (2.5, 'investor_report_title', 'Report Title'),
+    (4, 'investor_report_metrics', 'Key Metrics')
+)
+CUSTOMER_REPORT_HEADERS = (
+    'Username', 'Email', 'Role', 'Trial', 'Trial End', 'Subscribed',
+    'Debtors', 'Creditors', 'Receipts', 'Payments', 'Latest Fund', 'Latest Forecast'
+)
+CUSTOMER_REPORT_X_POSITIONS = tuple(0.5 * inch + i * 0.5 * inch for i in range(len(CUSTOMER_REPORT_HEADERS)))
+
+def translate_columns(columns):
+    """Resolve column specs to (x in points, translated label) once per document."""
+    return [(x * inch, trans(key, default=default)) for x, key, default in columns]
+
+def stamp_table_headers(p, y, labels, font_size=12):
+    """
+    Draw the column label row from a form XObject recorded on first use, so later pages reference it with one operator.
+    labels are (x in points, text) pairs; the row font and fill are left set for the table body.
+    """
+    form_name = f"tableHeader{int(y * 100)}"
+    if not p.hasForm(form_name):
+        p.beginForm(form_name)
+        p.setFont("Helvetica", font_size)
+        p.setFillColor(colors.black)
+        for x, label in labels:
+            p.drawString(x, y * inch, label)
+        p.endForm()
+    p.doForm(form_name)
+    p.setFont("Helvetica", font_size)
+    p.setFillColor(colors.black)
+
+def paginate(rows, rows_per_page):
+    """Split pre-formatted rows into page-sized chunks; an empty report still gets one page."""
+    return [rows[i:i + rows_per_page] for i in range(0, len(rows), rows_per_page)] or [[]]
+
+def draw_table_rows(text, y, column_x, rows, row_height):
+    """
+    Queue one page of table rows on a text object, with column_x in points, and return the y below the last row.
+    Only each row start is positioned absolutely; later columns use relative cursor moves (Td) rather than a full Tm each.
+    Text object methods and column offsets are bound to locals once per page, as this is the innermost export loop.
+    """
+    set_origin = text.setTextOrigin
+    move_cursor = text.moveCursor
+    text_out = text.textOut
+    first_x = column_x[0]
+    # Offset from the previous column for every cell after the first
+    column_steps = [x - previous_x for previous_x, x in zip(column_x, column_x[1:])]
+    points_per_unit = inch
+    for row in rows:
+        set_origin(first_x, y * points_per_unit)
+        text_out(row[0])
+        for step, value in zip(column_steps, row[1:]):
+            if step:
+                move_cursor(step, 0)
+            text_out(value)
+        y -= row_height
+    return y
+
 def generate_profit_loss_pdf(cashflows):
     buffer = BytesIO()
-    p = canvas.Canvas(buffer, pagesize=A4)
+    p = canvas.Canvas(buffer, pagesize=A4, pageCompression=1)
+    user_line = ficore_user_line(current_user)
     header_height = 0.7
     extra_space = 0.2
     row_height = 0.3
@@ -838,44 +934,44 @@ def generate_profit_loss_pdf(cashflows):
     page_height = (max_y - bottom_margin) * inch
     rows_per_page = int((page_height - (title_y - 0.6) * inch) / (row_height * inch))
 
+    headers = translate_columns(PROFIT_LOSS_COLUMNS)
+
     def draw_table_headers(y):
-        p.setFillColor(colors.black)
-        p.drawString(1 * inch, y * inch, trans('general_date', default='Date'))
-        p.drawString(2.5 * inch, y * inch, trans('general_party_name', default='Party Name'))
-        p.drawString(4 * inch, y * inch, trans('general_type', default='Type'))
-        p.drawString(5 * inch, y * inch, trans('general_amount', default='Amount'))
+        stamp_table_headers(p, y, headers)
         return y - row_height
 
-    draw_ficore_pdf_header(p, current_user, y_start=max_y)
+    draw_ficore_pdf_header(p, current_user, y_start=max_y, user_line=user_line)
     p.setFont("Helvetica", 12)
     p.drawString(1 * inch, title_y * inch, trans('reports_profit_loss_report', default='Profit/Loss Report'))
     p.drawString(1 * inch, (title_y - 0.3) * inch, f"{trans('reports_generated_on', default='Generated on')}: {utils.format_date(datetime.now(timezone.utc))}")
     y = title_y - 0.6
     y = draw_table_headers(y)
 
-    total_income = 0
-    total_expense = 0
-    row_count = 0
+    # Format every row up front so the page loop below only emits text
+    column_x = [x for x, _ in headers]
 
-    for t in cashflows:
-        if row_count >= rows_per_page:
+    def format_row(t):
+        return (
+            utils.format_date(t['created_at']),
+            t['party_name'],
+            trans(t['type'], default=t['type']),
+            utils.format_currency(t['amount']),
+        )
+
+    rows = [format_row(t) for t in cashflows]
+    total_income = sum(t['amount'] for t in cashflows if t['type'] == 'receipt')
+    total_expense = sum(t['amount'] for t in cashflows if t['type'] != 'receipt')
+    pages = paginate(rows, rows_per_page)
+    for page_number, page_rows in enumerate(pages):
+        if page_number:
             p.showPage()
-            draw_ficore_pdf_header(p, current_user, y_start=max_y)
+            draw_ficore_pdf_header(p, current_user, y_start=max_y, user_line=user_line)
             y = title_y - 0.6
             y = draw_table_headers(y)
-            row_count = 0
-
-        p.drawString(1 * inch, y * inch, utils.format_date(t['created_at']))
-        p.drawString(2.5 * inch, y * inch, utils.sanitize_input(t['party_name'], max_length=100))
-        p.drawString(4 * inch, y * inch, trans(t['type'], default=t['type']))
-        p.drawString(5 * inch, y * inch, utils.format_currency(t['amount']))
-        if t['type'] == 'receipt':
-            total_income += t['amount']
-        else:
-            total_expense += t['amount']
-        y -= row_height
-        row_count += 1
-
+        text = p.beginText()
+        y = draw_table_rows(text, y, column_x, page_rows, row_height)
+        p.drawText(text)
+    row_count = len(pages[-1])
     if row_count + 3 <= rows_per_page:
         y -= row_height
         p.drawString(1 * inch, y * inch, f"{trans('reports_total_income', default='Total Income')}: {utils.format_currency(total_income)}")
@@ -885,7 +981,7 @@ def generate_profit_loss_pdf(cashflows):
         p.drawString(1 * inch, y * inch, f"{trans('reports_net_profit', default='Net Profit')}: {utils.format_currency(total_income - total_expense)}")
     else:
         p.showPage()
-        draw_ficore_pdf_header(p, current_user, y_start=max_y)
+        draw_ficore_pdf_header(p, current_user, y_start=max_y, user_line=user_line)
         y = title_y - 0.6
         p.drawString(1 * inch, y * inch, f"{trans('reports_total_income', default='Total Income')}: {utils.format_currency(total_income)}")
         y -= row_height
@@ -899,7 +995,7 @@ def generate_profit_loss_pdf(cashflows):
         f"Generated profit/loss PDF for user {current_user.id}",
         extra={'session_id': session.get('sid', 'no-session-id'), 'user_id': current_user.id}
     )
-    return Response(buffer, mimetype='application/pdf', headers={'Content-Disposition': 'attachment;filename=profit_loss.pdf'})
+    return send_file(buffer, mimetype='application/pdf', as_attachment=True, download_name='profit_loss.pdf')
 
 def generate_profit_loss_csv(cashflows):
     output = []
@@ -908,7 +1004,7 @@ def generate_profit_loss_csv(cashflows):
     total_income = 0
     total_expense = 0
     for t in cashflows:
-        output.append([utils.format_date(t['created_at']), utils.sanitize_input(t['party_name'], max_length=100), trans(t['type'], default=t['type']), utils.format_currency(t['amount'])])
+        output.append([utils.format_date(t['created_at']), t['party_name'], trans(t['type'], default=t['type']), utils.format_currency(t['amount'])])
         if t['type'] == 'receipt':
             total_income += t['amount']
         else:
@@ -928,7 +1024,8 @@ def generate_profit_loss_csv(cashflows):
 
 def generate_debtors_creditors_pdf(records):
     buffer = BytesIO()
-    p = canvas.Canvas(buffer, pagesize=A4)
+    p = canvas.Canvas(buffer, pagesize=A4, pageCompression=1)
+    user_line = ficore_user_line(current_user)
     header_height = 0.7
     extra_space = 0.2
     row_height = 0.3
@@ -938,46 +1035,45 @@ def generate_debtors_creditors_pdf(records):
     page_height = (max_y - bottom_margin) * inch
     rows_per_page = int((page_height - (title_y - 0.6) * inch) / (row_height * inch))
 
+    headers = translate_columns(DEBTORS_CREDITORS_COLUMNS)
+
     def draw_table_headers(y):
-        p.setFillColor(colors.black)
-        p.drawString(1 * inch, y * inch, trans('general_date', default='Date'))
-        p.drawString(2.5 * inch, y * inch, trans('general_name', default='Name'))
-        p.drawString(4 * inch, y * inch, trans('general_type', default='Type'))
-        p.drawString(5 * inch, y * inch, trans('general_amount_owed', default='Amount Owed'))
-        p.drawString(6.5 * inch, y * inch, trans('general_description', default='Description'))
+        stamp_table_headers(p, y, headers)
         return y - row_height
 
-    draw_ficore_pdf_header(p, current_user, y_start=max_y)
+    draw_ficore_pdf_header(p, current_user, y_start=max_y, user_line=user_line)
     p.setFont("Helvetica", 12)
     p.drawString(1 * inch, title_y * inch, trans('reports_debtors_creditors_report', default='Debtors/Creditors Report'))
     p.drawString(1 * inch, (title_y - 0.3) * inch, f"{trans('reports_generated_on', default='Generated on')}: {utils.format_date(datetime.now(timezone.utc))}")
     y = title_y - 0.6
     y = draw_table_headers(y)
 
-    total_debtors = 0
-    total_creditors = 0
-    row_count = 0
+    # Format every row up front so the page loop below only emits text
+    column_x = [x for x, _ in headers]
 
-    for r in records:
-        if row_count >= rows_per_page:
+    def format_row(r):
+        return (
+            utils.format_date(r['created_at']),
+            r['name'],
+            trans(r['type'], default=r['type']),
+            utils.format_currency(r['amount_owed']),
+            r['description'][:20],
+        )
+
+    rows = [format_row(r) for r in records]
+    total_debtors = sum(r['amount_owed'] for r in records if r['type'] == 'debtor')
+    total_creditors = sum(r['amount_owed'] for r in records if r['type'] != 'debtor')
+    pages = paginate(rows, rows_per_page)
+    for page_number, page_rows in enumerate(pages):
+        if page_number:
             p.showPage()
-            draw_ficore_pdf_header(p, current_user, y_start=max_y)
+            draw_ficore_pdf_header(p, current_user, y_start=max_y, user_line=user_line)
             y = title_y - 0.6
             y = draw_table_headers(y)
-            row_count = 0
-
-        p.drawString(1 * inch, y * inch, utils.format_date(r['created_at']))
-        p.drawString(2.5 * inch, y * inch, utils.sanitize_input(r['name'], max_length=100))
-        p.drawString(4 * inch, y * inch, trans(r['type'], default=r['type']))
-        p.drawString(5 * inch, y * inch, utils.format_currency(r['amount_owed']))
-        p.drawString(6.5 * inch, y * inch, utils.sanitize_input(r.get('description', ''), max_length=20))
-        if r['type'] == 'debtor':
-            total_debtors += r['amount_owed']
-        else:
-            total_creditors += r['amount_owed']
-        y -= row_height
-        row_count += 1
-
+        text = p.beginText()
+        y = draw_table_rows(text, y, column_x, page_rows, row_height)
+        p.drawText(text)
+    row_count = len(pages[-1])
     if row_count + 2 <= rows_per_page:
         y -= row_height
         p.drawString(1 * inch, y * inch, f"{trans('reports_total_debtors', default='Total Debtors')}: {utils.format_currency(total_debtors)}")
@@ -985,7 +1081,7 @@ def generate_debtors_creditors_pdf(records):
         p.drawString(1 * inch, y * inch, f"{trans('reports_total_creditors', default='Total Creditors')}: {utils.format_currency(total_creditors)}")
     else:
         p.showPage()
-        draw_ficore_pdf_header(p, current_user, y_start=max_y)
+        draw_ficore_pdf_header(p, current_user, y_start=max_y, user_line=user_line)
         y = title_y - 0.6
         p.drawString(1 * inch, y * inch, f"{trans('reports_total_debtors', default='Total Debtors')}: {utils.format_currency(total_debtors)}")
         y -= row_height
@@ -997,7 +1093,7 @@ def generate_debtors_creditors_pdf(records):
         f"Generated debtors/creditors PDF for user {current_user.id}",
         extra={'session_id': session.get('sid', 'no-session-id'), 'user_id': current_user.id}
     )
-    return Response(buffer, mimetype='application/pdf', headers={'Content-Disposition': 'attachment;filename=debtors_creditors.pdf'})
+    return send_file(buffer, mimetype='application/pdf', as_attachment=True, download_name='debtors_creditors.pdf')
 
 def generate_debtors_creditors_csv(records):
     output = []
@@ -1006,7 +1102,7 @@ def generate_debtors_creditors_csv(records):
     total_debtors = 0
     total_creditors = 0
     for r in records:
-        output.append([utils.format_date(r['created_at']), utils.sanitize_input(r['name'], max_length=100), trans(r['type'], default=r['type']), utils.format_currency(r['amount_owed']), utils.sanitize_input(r.get('description', ''), max_length=1000)])
+        output.append([utils.format_date(r['created_at']), r['name'], trans(r['type'], default=r['type']), utils.format_currency(r['amount_owed']), r['description']])
         if r['type'] == 'debtor':
             total_debtors += r['amount_owed']
         else:
@@ -1025,7 +1121,8 @@ def generate_debtors_creditors_csv(records):
 
 def generate_funds_pdf(funds):
     buffer = BytesIO()
-    p = canvas.Canvas(buffer, pagesize=A4)
+    p = canvas.Canvas(buffer, pagesize=A4, pageCompression=1)
+    user_line = ficore_user_line(current_user)
     header_height = 0.7
     extra_space = 0.2
     row_height = 0.3
@@ -1035,46 +1132,49 @@ def generate_funds_pdf(funds):
     page_height = (max_y - bottom_margin) * inch
     rows_per_page = int((page_height - (title_y - 0.6) * inch) / (row_height * inch))
 
+    headers = translate_columns(FUNDS_COLUMNS)
+
     def draw_table_headers(y):
-        p.setFillColor(colors.black)
-        p.drawString(1 * inch, y * inch, trans('general_date', default='Date'))
-        p.drawString(2.5 * inch, y * inch, trans('funds_source', default='Source'))
-        p.drawString(4 * inch, y * inch, trans('general_amount', default='Amount'))
-        p.drawString(5 * inch, y * inch, trans('general_status', default='Status'))
+        stamp_table_headers(p, y, headers)
         return y - row_height
 
-    draw_ficore_pdf_header(p, current_user, y_start=max_y)
+    draw_ficore_pdf_header(p, current_user, y_start=max_y, user_line=user_line)
     p.setFont("Helvetica", 12)
     p.drawString(1 * inch, title_y * inch, trans('reports_funds_report', default='Funds Report'))
     p.drawString(1 * inch, (title_y - 0.3) * inch, f"{trans('reports_generated_on', default='Generated on')}: {utils.format_date(datetime.now(timezone.utc))}")
     y = title_y - 0.6
     y = draw_table_headers(y)
 
-    total_amount = 0
-    row_count = 0
+    # Format every row up front so the page loop below only emits text
+    column_x = [x for x, _ in headers]
 
-    for f in funds:
-        if row_count >= rows_per_page:
+    def format_row(f):
+        return (
+            utils.format_date(f['created_at']),
+            f['source'],
+            utils.format_currency(f['amount']),
+            trans(f['status'], default=f['status']),
+        )
+
+    rows = [format_row(f) for f in funds]
+    total_amount = sum(f['amount'] for f in funds)
+    pages = paginate(rows, rows_per_page)
+    for page_number, page_rows in enumerate(pages):
+        if page_number:
             p.showPage()
-            draw_ficore_pdf_header(p, current_user, y_start=max_y)
+            draw_ficore_pdf_header(p, current_user, y_start=max_y, user_line=user_line)
             y = title_y - 0.6
             y = draw_table_headers(y)
-            row_count = 0
-
-        p.drawString(1 * inch, y * inch, utils.format_date(f['created_at']))
-        p.drawString(2.5 * inch, y * inch, utils.sanitize_input(f['source'], max_length=100))
-        p.drawString(4 * inch, y * inch, utils.format_currency(f['amount']))
-        p.drawString(5 * inch, y * inch, trans(f['status'], default=f['status']))
-        total_amount += f['amount']
-        y -= row_height
-        row_count += 1
-
+        text = p.beginText()
+        y = draw_table_rows(text, y, column_x, page_rows, row_height)
+        p.drawText(text)
+    row_count = len(pages[-1])
     if row_count + 1 <= rows_per_page:
         y -= row_height
         p.drawString(1 * inch, y * inch, f"{trans('reports_total_funds', default='Total Funds')}: {utils.format_currency(total_amount)}")
     else:
         p.showPage()
-        draw_ficore_pdf_header(p, current_user, y_start=max_y)
+        draw_ficore_pdf_header(p, current_user, y_start=max_y, user_line=user_line)
         y = title_y - 0.6
         p.drawString(1 * inch, y * inch, f"{trans('reports_total_funds', default='Total Funds')}: {utils.format_currency(total_amount)}")
 
@@ -1084,7 +1184,7 @@ def generate_funds_pdf(funds):
         f"Generated funds PDF for user {current_user.id}",
         extra={'session_id': session.get('sid', 'no-session-id'), 'user_id': current_user.id}
     )
-    return Response(buffer, mimetype='application/pdf', headers={'Content-Disposition': 'attachment;filename=funds.pdf'})
+    return send_file(buffer, mimetype='application/pdf', as_attachment=True, download_name='funds.pdf')
 
 def generate_funds_csv(funds):
     output = []
@@ -1092,7 +1192,7 @@ def generate_funds_csv(funds):
     output.append([trans('general_date', default='Date'), trans('funds_source', default='Source'), trans('general_amount', default='Amount'), trans('general_status', default='Status')])
     total_amount = 0
     for f in funds:
-        output.append([utils.format_date(f['created_at']), utils.sanitize_input(f['source'], max_length=100), utils.format_currency(f['amount']), trans(f['status'], default=f['status'])])
+        output.append([utils.format_date(f['created_at']), f['source'], utils.format_currency(f['amount']), trans(f['status'], default=f['status'])])
         total_amount += f['amount']
     output.append(['', '', f"{trans('reports_total_funds', default='Total Funds')}: {utils.format_currency(total_amount)}", ''])
     buffer = StringIO()
@@ -1107,7 +1207,8 @@ def generate_funds_csv(funds):
 
 def generate_forecasts_pdf(forecasts):
     buffer = BytesIO()
-    p = canvas.Canvas(buffer, pagesize=A4)
+    p = canvas.Canvas(buffer, pagesize=A4, pageCompression=1)
+    user_line = ficore_user_line(current_user)
     header_height = 0.7
     extra_space = 0.2
     row_height = 0.3
@@ -1117,45 +1218,46 @@ def generate_forecasts_pdf(forecasts):
     page_height = (max_y - bottom_margin) * inch
     rows_per_page = int((page_height - (title_y - 0.6) * inch) / (row_height * inch))
 
+    headers = translate_columns(FORECASTS_COLUMNS)
+
     def draw_table_headers(y):
-        p.setFillColor(colors.black)
-        p.drawString(1 * inch, y * inch, trans('general_date', default='Date'))
-        p.drawString(2 * inch, y * inch, trans('forecasts_scenario', default='Scenario'))
-        p.drawString(3.5 * inch, y * inch, trans('forecasts_projected_revenue', default='Projected Revenue'))
-        p.drawString(4.5 * inch, y * inch, trans('forecasts_projected_expenses', default='Projected Expenses'))
-        p.drawString(5.5 * inch, y * inch, trans('forecasts_period', default='Period'))
+        stamp_table_headers(p, y, headers)
         return y - row_height
 
-    draw_ficore_pdf_header(p, current_user, y_start=max_y)
+    draw_ficore_pdf_header(p, current_user, y_start=max_y, user_line=user_line)
     p.setFont("Helvetica", 12)
     p.drawString(1 * inch, title_y * inch, trans('reports_forecasts_report', default='Forecasts Report'))
     p.drawString(1 * inch, (title_y - 0.3) * inch, f"{trans('reports_generated_on', default='Generated on')}: {utils.format_date(datetime.now(timezone.utc))}")
     y = title_y - 0.6
     y = draw_table_headers(y)
 
-    total_revenue = 0
-    total_expenses = 0
-    row_count = 0
+    # Format every row up front so the page loop below only emits text
+    column_x = [x for x, _ in headers]
 
-    for f in forecasts:
-        if row_count >= rows_per_page:
+    def format_row(f):
+        period = f"{utils.format_date(f['period_start'])} - {utils.format_date(f['period_end'])}" if f['period_start'] and f['period_end'] else '-'
+        return (
+            utils.format_date(f['created_at']),
+            f['scenario'][:20],
+            utils.format_currency(f['projected_revenue']),
+            utils.format_currency(f['projected_expenses']),
+            period[:20],
+        )
+
+    rows = [format_row(f) for f in forecasts]
+    total_revenue = sum(f['projected_revenue'] for f in forecasts)
+    total_expenses = sum(f['projected_expenses'] for f in forecasts)
+    pages = paginate(rows, rows_per_page)
+    for page_number, page_rows in enumerate(pages):
+        if page_number:
             p.showPage()
-            draw_ficore_pdf_header(p, current_user, y_start=max_y)
+            draw_ficore_pdf_header(p, current_user, y_start=max_y, user_line=user_line)
             y = title_y - 0.6
             y = draw_table_headers(y)
-            row_count = 0
-
-        period = f"{utils.format_date(f['period_start'])} - {utils.format_date(f['period_end'])}" if f['period_start'] and f['period_end'] else '-'
-        p.drawString(1 * inch, y * inch, utils.format_date(f['created_at']))
-        p.drawString(2 * inch, y * inch, utils.sanitize_input(f['scenario'][:20], max_length=20))
-        p.drawString(3.5 * inch, y * inch, utils.format_currency(f['projected_revenue']))
-        p.drawString(4.5 * inch, y * inch, utils.format_currency(f['projected_expenses']))
-        p.drawString(5.5 * inch, y * inch, period[:20])
-        total_revenue += f['projected_revenue']
-        total_expenses += f['projected_expenses']
-        y -= row_height
-        row_count += 1
-
+        text = p.beginText()
+        y = draw_table_rows(text, y, column_x, page_rows, row_height)
+        p.drawText(text)
+    row_count = len(pages[-1])
     if row_count + 2 <= rows_per_page:
         y -= row_height
         p.drawString(1 * inch, y * inch, f"{trans('reports_total_projected_revenue', default='Total Projected Revenue')}: {utils.format_currency(total_revenue)}")
@@ -1163,7 +1265,7 @@ def generate_forecasts_pdf(forecasts):
         p.drawString(1 * inch, y * inch, f"{trans('reports_total_projected_expenses', default='Total Projected Expenses')}: {utils.format_currency(total_expenses)}")
     else:
         p.showPage()
-        draw_ficore_pdf_header(p, current_user, y_start=max_y)
+        draw_ficore_pdf_header(p, current_user, y_start=max_y, user_line=user_line)
         y = title_y - 0.6
         p.drawString(1 * inch, y * inch, f"{trans('reports_total_projected_revenue', default='Total Projected Revenue')}: {utils.format_currency(total_revenue)}")
         y -= row_height
@@ -1175,7 +1277,7 @@ def generate_forecasts_pdf(forecasts):
         f"Generated forecasts PDF for user {current_user.id}",
         extra={'session_id': session.get('sid', 'no-session-id'), 'user_id': current_user.id}
     )
-    return Response(buffer, mimetype='application/pdf', headers={'Content-Disposition': 'attachment;filename=forecasts.pdf'})
+    return send_file(buffer, mimetype='application/pdf', as_attachment=True, download_name='forecasts.pdf')
 
 def generate_forecasts_csv(forecasts):
     output = []
@@ -1193,7 +1295,7 @@ def generate_forecasts_csv(forecasts):
         period = f"{utils.format_date(f['period_start'])} - {utils.format_date(f['period_end'])}" if f['period_start'] and f['period_end'] else '-'
         output.append([
             utils.format_date(f['created_at']),
-            utils.sanitize_input(f['scenario'], max_length=100),
+            f['scenario'],
             utils.format_currency(f['projected_revenue']),
             utils.format_currency(f['projected_expenses']),
             period
@@ -1213,7 +1315,8 @@ def generate_forecasts_csv(forecasts):
 
 def generate_investor_reports_pdf(reports):
     buffer = BytesIO()
-    p = canvas.Canvas(buffer, pagesize=A4)
+    p = canvas.Canvas(buffer, pagesize=A4, pageCompression=1)
+    user_line = ficore_user_line(current_user)
     header_height = 0.7
     extra_space = 0.2
     row_height = 0.3
@@ -1223,39 +1326,44 @@ def generate_investor_reports_pdf(reports):
     page_height = (max_y - bottom_margin) * inch
     rows_per_page = int((page_height - (title_y - 0.6) * inch) / (row_height * inch))
 
+    headers = translate_columns(INVESTOR_REPORTS_COLUMNS)
+
     def draw_table_headers(y):
-        p.setFillColor(colors.black)
-        p.drawString(1 * inch, y * inch, trans('general_date', default='Date'))
-        p.drawString(2.5 * inch, y * inch, trans('investor_report_title', default='Report Title'))
-        p.drawString(4 * inch, y * inch, trans('investor_report_metrics', default='Key Metrics'))
+        stamp_table_headers(p, y, headers)
         return y - row_height
 
-    draw_ficore_pdf_header(p, current_user, y_start=max_y)
+    draw_ficore_pdf_header(p, current_user, y_start=max_y, user_line=user_line)
     p.setFont("Helvetica", 12)
     p.drawString(1 * inch, title_y * inch, trans('reports_investor_reports', default='Investor Reports'))
     p.drawString(1 * inch, (title_y - 0.3) * inch, f"{trans('reports_generated_on', default='Generated on')}: {utils.format_date(datetime.now(timezone.utc))}")
     y = title_y - 0.6
     y = draw_table_headers(y)
 
-    row_count = 0
-    for r in reports:
-        if row_count >= rows_per_page:
-            p.showPage()
-            draw_ficore_pdf_header(p, current_user, y_start=max_y)
-            y = title_y - 0.6
-            y = draw_table_headers(y)
-            row_count = 0
+    # Format every row up front so the page loop below only emits text
+    column_x = [x for x, _ in headers]
 
+    def format_row(r):
         metrics_summary = ', '.join([f"{k}: {utils.format_currency(v)}" if isinstance(v, (int, float)) else f"{k}: {v}" for k, v in r['financial_metrics'].items()])[:50]
-        p.drawString(1 * inch, y * inch, utils.format_date(r['created_at']))
-        p.drawString(2.5 * inch, y * inch, r['title'][:20])
-        p.drawString(4 * inch, y * inch, metrics_summary)
-        y -= row_height
-        row_count += 1
+        return (
+            utils.format_date(r['created_at']),
+            r['title'][:20],
+            metrics_summary,
+        )
 
+    rows = [format_row(r) for r in reports]
+    pages = paginate(rows, rows_per_page)
+    for page_number, page_rows in enumerate(pages):
+        if page_number:
+            p.showPage()
+            draw_ficore_pdf_header(p, current_user, y_start=max_y, user_line=user_line)
+            y = title_y - 0.6
+            y = draw_table_headers(y)
+        text = p.beginText()
+        y = draw_table_rows(text, y, column_x, page_rows, row_height)
+        p.drawText(text)
     p.save()
     buffer.seek(0)
-    return Response(buffer, mimetype='application/pdf', headers={'Content-Disposition': 'attachment;filename=investor_reports.pdf'})
+    return send_file(buffer, mimetype='application/pdf', as_attachment=True, download_name='investor_reports.pdf')
 
 def generate_investor_reports_csv(reports):
     output = []
@@ -1272,7 +1380,8 @@ def generate_investor_reports_csv(reports):
 
 def generate_customer_report_pdf(report_data):
     buffer = BytesIO()
-    p = canvas.Canvas(buffer, pagesize=A4)
+    p = canvas.Canvas(buffer, pagesize=A4, pageCompression=1)
+    user_line = ficore_user_line(current_user)
     header_height = 0.7
     extra_space = 0.2
     row_height = 0.2
@@ -1283,33 +1392,19 @@ def generate_customer_report_pdf(report_data):
     rows_per_page = int((page_height - (title_y - 0.6) * inch) / (row_height * inch))
 
     def draw_table_headers(y):
-        p.setFillColor(colors.black)
-        headers = [
-            'Username', 'Email', 'Role', 'Trial', 'Trial End', 'Subscribed',
-            'Debtors', 'Creditors', 'Receipts', 'Payments', 'Latest Fund', 'Latest Forecast'
-        ]
-        x_positions = [0.5 * inch + i * 0.5 * inch for i in range(len(headers))]
-        for header, x in zip(headers, x_positions):
-            p.drawString(x, y * inch, header)
-        return y - row_height, x_positions
+        stamp_table_headers(p, y, zip(CUSTOMER_REPORT_X_POSITIONS, CUSTOMER_REPORT_HEADERS), font_size=8)
+        return y - row_height, CUSTOMER_REPORT_X_POSITIONS
 
-    draw_ficore_pdf_header(p, current_user, y_start=max_y)
+    draw_ficore_pdf_header(p, current_user, y_start=max_y, user_line=user_line)
     p.setFont("Helvetica", 8)
     p.drawString(0.5 * inch, title_y * inch, trans('reports_customer_report', default='Customer Report'))
     p.drawString(0.5 * inch, (title_y - 0.3) * inch, f"{trans('reports_generated_on', default='Generated on')}: {utils.format_date(datetime.utcnow())}")
     y = title_y - 0.6
     y, x_positions = draw_table_headers(y)
 
-    row_count = 0
-    for data in report_data:
-        if row_count >= rows_per_page:
-            p.showPage()
-            draw_ficore_pdf_header(p, current_user, y_start=max_y)
-            y = title_y - 0.6
-            y, x_positions = draw_table_headers(y)
-            row_count = 0
-
-        values = [
+    # Format every row up front so the page loop below only emits text
+    def format_row(data):
+        values = (
             data['username'][:15],
             data['email'][:15],
             data['role'],
@@ -1322,15 +1417,23 @@ def generate_customer_report_pdf(report_data):
             utils.format_currency(data['total_payments']),
             str(data['latest_fund_amount']),
             str(data['latest_forecast_revenue'])
-        ]
-        for value, x in zip(values, x_positions):
-            p.drawString(x, y * inch, str(value)[:15])
-        y -= row_height
-        row_count += 1
+        )
+        return tuple(str(value)[:15] for value in values)
 
+    rows = [format_row(data) for data in report_data]
+    pages = paginate(rows, rows_per_page)
+    for page_number, page_rows in enumerate(pages):
+        if page_number:
+            p.showPage()
+            draw_ficore_pdf_header(p, current_user, y_start=max_y, user_line=user_line)
+            y = title_y - 0.6
+            y, x_positions = draw_table_headers(y)
+        text = p.beginText()
+        y = draw_table_rows(text, y, x_positions, page_rows, row_height)
+        p.drawText(text)
     p.save()
     buffer.seek(0)
-    return Response(buffer, mimetype='application/pdf', headers={'Content-Disposition': 'attachment;filename=customer_report.pdf'})
+    return send_file(buffer, mimetype='application/pdf', as_attachment=True, download_name='customer_report.pdf')
 
 def generate_customer_report_csv(report_data):
     output = []
@@ -20,6 +20,17 @@ logger = logging.getLogger(__name__)
 
 settings_bp = Blueprint('settings', __name__, url_prefix='/settings')
 
+# Toggle name sent by the settings page -> (settings group, field) it updates
+USER_SETTING_FIELDS = {
+    'showKoboToggle': ('settings', 'show_kobo'),
+    'incognitoModeToggle': ('settings', 'incognito_mode'),
+    'appSoundsToggle': ('settings', 'app_sounds'),
+    'activitySidebarToggle': ('settings', 'activity_sidebar_enabled'),
+    'fingerprintPasswordToggle': ('security_settings', 'fingerprint_password'),
+    'fingerprintPinToggle': ('security_settings', 'fingerprint_pin'),
+    'hideSensitiveDataToggle': ('security_settings', 'hide_sensitive_data'),
+}
+
 class ProfileForm(FlaskForm):
     full_name = StringField(trans('general_full_name', default='Full Name'), [
         DataRequired(message=trans('general_full_name_required', default='Full name is required')),
@@ -356,40 +367,21 @@ def update_user_setting():
         data = request.get_json()
         setting_name = sanitize_input(data.get('setting'), max_length=50)
         value = data.get('value')
-        valid_settings = [
-            'showKoboToggle', 'incognitoModeToggle', 'appSoundsToggle',
-            'fingerprintPasswordToggle', 'fingerprintPinToggle', 'hideSensitiveDataToggle',
-            'activitySidebarToggle'
-        ]
-        if setting_name not in valid_settings:
+        setting_field = USER_SETTING_FIELDS.get(setting_name)
+        if setting_field is None:
             logger.error(
                 f"Invalid setting name {setting_name} for user {user_id}",
                 extra={'session_id': session.get('sid', 'no-session-id'), 'user_id': current_user.id}
             )
             return jsonify({"success": False, "message": trans('general_invalid_setting', default='Invalid setting name.')}), 400
 
-        settings = user.settings.copy()
-        security_settings = user.security_settings.copy()
-        if setting_name == 'showKoboToggle':
-            settings['show_kobo'] = bool(value)
-        elif setting_name == 'incognitoModeToggle':
-            settings['incognito_mode'] = bool(value)
-        elif setting_name == 'appSoundsToggle':
-            settings['app_sounds'] = bool(value)
-        elif setting_name == 'activitySidebarToggle':
-            settings['activity_sidebar_enabled'] = bool(value)
-        elif setting_name == 'fingerprintPasswordToggle':
-            security_settings['fingerprint_password'] = bool(value)
-        elif setting_name == 'fingerprintPinToggle':
-            security_settings['fingerprint_pin'] = bool(value)
-        elif setting_name == 'hideSensitiveDataToggle':
-            security_settings['hide_sensitive_data'] = bool(value)
-
         update_data = {
-            'settings': settings,
-            'security_settings': security_settings,
+            'settings': user.settings.copy(),
+            'security_settings': user.security_settings.copy(),
             'updated_at': datetime.now(timezone.utc)
         }
+        group, field = setting_field
+        update_data[group][field] = bool(value)
         if update_user(db, user_id, update_data):
             logger.info(
                 f"Setting {setting_name} updated for user {user_id}",
@@ -3,6 +3,7 @@ from flask_login import login_required, current_user
 from flask_wtf.csrf import CSRFError
 from translations import trans
 from models import update_user, get_mongo_db
+from pymongo import InsertOne
 import requests
 import utils
 import os
@@ -195,7 +196,7 @@ def callback():
         update_user(db, current_user.id, update_data)
 
         # Log audit event
-        db.audit_logs.insert_one({
+        utils.queue_write('audit_logs', InsertOne({
             'admin_id': 'system',
             'action': 'subscription_success',
             'details': {
@@ -205,7 +206,7 @@ def callback():
                 'amount': pending_transaction['amount']
             },
             'timestamp': datetime.now(timezone.utc)
-        })
+        }))
 
         logger.info(
             f"Subscription successful for user {current_user.id}, plan: {pending_transaction['plan_code']}, reference: {reference}",
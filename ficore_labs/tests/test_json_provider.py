@@ -0,0 +1,28 @@
+from datetime import datetime, timezone
+
+import pytest
+from flask import Flask, jsonify
+
+import utils
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    app.json = utils.ORJSONProvider(app)
+
+    @app.route('/payload')
+    def payload():
+        return jsonify({'b': 1, 'a': 2, 'updated_at': datetime(2024, 1, 1, tzinfo=timezone.utc)})
+
+    return app
+
+
+def test_response_matches_default_provider(app):
+    response = app.test_client().get('/payload')
+    assert response.get_data(as_text=True) == '{"a":2,"b":1,"updated_at":"Mon, 01 Jan 2024 00:00:00 GMT"}'
+
+
+def test_dumps_stringifies_non_string_keys(app):
+    with app.app_context():
+        assert app.json.dumps({2: 'x', 1: datetime(2024, 1, 1)}) == '{"1":"Mon, 01 Jan 2024 00:00:00 GMT","2":"x"}'
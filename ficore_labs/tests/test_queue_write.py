@@ -0,0 +1,73 @@
+import pytest
+from flask import Flask, current_app
+from flask_login import LoginManager
+from pymongo import InsertOne
+
+import utils
+
+
+class FakeCollection:
+    def __init__(self, name, calls):
+        self.name = name
+        self.calls = calls
+
+    def bulk_write(self, operations, ordered=True):
+        self.calls.append((self.name, list(operations), ordered))
+
+
+class FakeDB:
+    def __init__(self):
+        self.calls = []
+
+    def __getitem__(self, name):
+        return FakeCollection(name, self.calls)
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    db = FakeDB()
+    monkeypatch.setattr(utils, 'get_mongo_db', lambda: db)
+    return db
+
+
+@pytest.fixture
+def app(fake_db):
+    app = Flask(__name__)
+    app.secret_key = 'test'
+    LoginManager(app)
+    app.after_request(utils.flush_pending_writes)
+
+    @app.route('/log-action')
+    def log_action():
+        # Mirrors requires_role, which runs views under a nested app context
+        with current_app.app_context():
+            utils.log_user_action('test_action', {'source': 'test'}, user_id='user-1')
+        return 'ok'
+
+    @app.route('/explicit-db')
+    def explicit_db():
+        other_db = FakeDB()
+        utils.queue_write('tool_usage', InsertOne({'action': 'explicit'}), db=other_db)
+        return str(len(other_db.calls))
+
+    return app
+
+
+def test_logged_action_is_flushed_with_bulk_write(app, fake_db):
+    response = app.test_client().get('/log-action')
+
+    assert response.status_code == 200
+    assert len(fake_db.calls) == 1
+    collection, operations, ordered = fake_db.calls[0]
+    assert collection == 'audit_logs'
+    assert ordered is False
+    assert len(operations) == 1
+    assert operations[0]._doc['action'] == 'test_action'
+    assert operations[0]._doc['user_id'] == 'user-1'
+
+
+def test_explicit_db_is_written_immediately(app, fake_db):
+    response = app.test_client().get('/explicit-db')
+
+    assert response.get_data(as_text=True) == '1'
+    assert fake_db.calls == []
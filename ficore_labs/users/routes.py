@@ -6,7 +6,7 @@ from flask import Blueprint, render_template, request, redirect, url_for, flash,
 from flask_wtf import FlaskForm
 from wtforms import StringField, PasswordField, TextAreaField, SelectField, SubmitField, BooleanField, validators
 from flask_login import login_required, current_user, login_user, logout_user
-from pymongo import errors
+from pymongo import errors, InsertOne
 from werkzeug.security import generate_password_hash, check_password_hash
 from flask_mailman import EmailMessage
 import re
@@ -145,7 +145,6 @@ class BusinessSetupForm(FlaskForm):
 
 def log_audit_action(action, details=None):
     try:
-        db = utils.get_mongo_db()
         log_entry = {
             'action': action,
             'details': details or {},
@@ -158,7 +157,7 @@ def log_audit_action(action, details=None):
         else:
             log_entry['admin_id'] = None
             
-        db.audit_logs.insert_one(log_entry)
+        utils.queue_write('audit_logs', InsertOne(log_entry))
     except pymongo.errors.PyMongoError as e:
         logger.error(f"Error logging audit action '{action}': {str(e)}")
     except Exception as e:
@@ -452,12 +451,12 @@ def signup():
 
             db = utils.get_mongo_db()
 
-            if db.users.find_one({'_id': username}):
+            if db.users.find_one({'_id': username}, {'_id': 1}):
                 flash(trans('general_username_exists', default='Username already exists'), 'danger')
                 logger.warning(f"Signup failed: Username {username} already exists")
                 return render_template('users/signup.html', form=form, title=trans('general_signup', lang=session.get('lang', 'en')))
 
-            if db.users.find_one({'email': email}):
+            if db.users.find_one({'email': email}, {'_id': 1}):
                 flash(trans('general_email_exists', default='Email already exists'), 'danger')
                 logger.warning(f"Signup failed: Email {email} already exists")
                 return render_template('users/signup.html', form=form, title=trans('general_signup', lang=session.get('lang', 'en')))
@@ -488,12 +487,12 @@ def signup():
                 logger.error(f"Failed to insert user: {username}")
                 return render_template('users/signup.html', form=form, title=trans('general_signup', lang=session.get('lang', 'en'))), 500
 
-            db.audit_logs.insert_one({
+            utils.queue_write('audit_logs', InsertOne({
                 'admin_id': None,  # System action, no admin involved
                 'action': 'signup',
                 'details': {'user_id': username, 'role': role},
                 'timestamp': datetime.now(timezone.utc)
-            })
+            }))
 
             user_obj = User(
                 id=username,
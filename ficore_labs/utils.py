@@ -3,13 +3,18 @@ import logging
 import uuid
 import os
 import certifi
-from datetime import datetime, timedelta, timezone
+import orjson
+from collections import defaultdict
+from functools import lru_cache
+from datetime import date, datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
-from flask import session, has_request_context, current_app, url_for, request
+from flask import session, has_request_context, current_app, url_for, request, g
+from flask.json.provider import DefaultJSONProvider
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
-from pymongo import MongoClient
+from pymongo import MongoClient, InsertOne
 from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
+from werkzeug.http import http_date
 from werkzeug.routing import BuildError
 from wtforms import ValidationError
 from flask_login import current_user
@@ -51,6 +56,11 @@ class SessionAdapter(logging.LoggerAdapter):
 
 logger = SessionAdapter(root_logger, {})
 
+# Input cleaning tables and patterns, built once at import rather than per call
+UNSAFE_INPUT_CHARS = str.maketrans('', '', '<>"\'')
+NON_NUMERIC_REGEX = re.compile(r'[^\d.]')
+EMAIL_REGEX = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
 # Navigation lists
 _TRADER_TOOLS = [
     {
@@ -424,7 +434,7 @@ def log_tool_usage(action, tool_name=None, details=None, user_id=None, db=None,
             'ip_address': request.remote_addr if has_request_context() else 'unknown',
             'user_agent': request.headers.get('User-Agent') if has_request_context() else 'unknown'
         }
-        db.tool_usage.insert_one(log_entry)
+        queue_write('tool_usage', InsertOne(log_entry), db=db)
         logger.info(f"Logged tool usage: {action}", extra={'session_id': effective_session_id, 'user_id': user_id or 'none'})
     except Exception as e:
         logger.error(f"Failed to log tool usage for action {action}: {str(e)}", extra={'session_id': session_id or 'no-session-id'})
@@ -448,8 +458,6 @@ def create_anonymous_session():
 
 def clean_currency(value, max_value=10000000000):
     try:
-        if value is None or (isinstance(value, str) and value.strip() == ''):
-            return 0.0
         if isinstance(value, (int, float)):
             value = float(value)
             if value > max_value:
@@ -457,8 +465,10 @@ def clean_currency(value, max_value=10000000000):
             if value < 0:
                 raise ValidationError("Negative currency values are not allowed")
             return value
+        if value is None or (isinstance(value, str) and value.strip() == ''):
+            return 0.0
         value_str = str(value).strip()
-        cleaned = re.sub(r'[^\d.]', '', value_str.replace('NGN', '').replace('₦', '').replace('$', '').replace('€', '').replace('£', '').replace(',', ''))
+        cleaned = NON_NUMERIC_REGEX.sub('', value_str.replace('NGN', '').replace('₦', '').replace('$', '').replace('€', '').replace('£', '').replace(',', ''))
         parts = cleaned.split('.')
         if len(parts) > 2 or cleaned.count('-') > 1 or (cleaned.count('-') == 1 and not cleaned.startswith('-')):
             raise ValidationError('Invalid currency format')
@@ -477,34 +487,77 @@ def clean_currency(value, max_value=10000000000):
 def is_valid_email(email):
     if not email or not isinstance(email, str):
         return False
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email.strip()) is not None
+    return EMAIL_REGEX.match(email.strip()) is not None
 
 def get_mongo_db():
+    """
+    Return the bizdb database handle.
+
+    The MongoClient is created once and shared through current_app.extensions;
+    the handle is memoized on flask.g so repeated calls within a request are free.
+    """
+    if 'mongo_db' in g:
+        return g.mongo_db
     try:
-        with current_app.app_context():
-            if 'mongo' not in current_app.extensions:
-                mongo_uri = os.getenv('MONGO_URI')
-                if not mongo_uri:
-                    logger.error("MONGO_URI environment variable not set", extra={'session_id': 'no-session-id'})
-                    raise RuntimeError("MONGO_URI environment variable not set")
-                client = MongoClient(
-                    mongo_uri,
-                    serverSelectionTimeoutMS=5000,
-                    tls=True,
-                    tlsCAFile=certifi.where(),
-                    maxPoolSize=50,
-                    minPoolSize=5
-                )
-                client.admin.command('ping')
-                current_app.extensions['mongo'] = client
-            db = current_app.extensions['mongo']['bizdb']
-            db.command('ping')
-            return db
+        if 'mongo' not in current_app.extensions:
+            mongo_uri = os.getenv('MONGO_URI')
+            if not mongo_uri:
+                logger.error("MONGO_URI environment variable not set", extra={'session_id': 'no-session-id'})
+                raise RuntimeError("MONGO_URI environment variable not set")
+            client = MongoClient(
+                mongo_uri,
+                serverSelectionTimeoutMS=5000,
+                tls=True,
+                tlsCAFile=certifi.where(),
+                maxPoolSize=50,
+                minPoolSize=5
+            )
+            client.admin.command('ping')
+            current_app.extensions['mongo'] = client
+        g.mongo_db = current_app.extensions['mongo']['bizdb']
+        return g.mongo_db
     except (ConnectionFailure, ServerSelectionTimeoutError) as e:
         logger.error(f"Failed to connect to MongoDB: {str(e)}", extra={'session_id': 'no-session-id'})
         raise RuntimeError(f"Failed to connect to MongoDB: {str(e)}")
 
+PENDING_WRITES_ENVIRON_KEY = 'ficore.pending_writes'
+
+def queue_write(collection, operation, db=None):
+    """
+    Queue a write operation (e.g. InsertOne) for the current request.
+
+    Queued operations are flushed by flush_pending_writes with a single
+    unordered bulk_write per collection once the request has been handled.
+    The queue lives in the WSGI environ rather than g, so writes queued under
+    a nested app_context() (as requires_role and several helpers push) are not
+    dropped when that context exits. Outside a request context, or when the
+    caller passes an explicit db handle, the operation is written immediately
+    so it lands on that handle and failures propagate to the caller.
+    """
+    if db is not None or not has_request_context():
+        if db is None:
+            db = get_mongo_db()
+        db[collection].bulk_write([operation], ordered=False)
+        return
+    pending_writes = request.environ.setdefault(PENDING_WRITES_ENVIRON_KEY, defaultdict(list))
+    pending_writes[collection].append(operation)
+
+def flush_pending_writes(response=None):
+    """Flush writes queued with queue_write; registered as an after_request hook."""
+    pending_writes = request.environ.pop(PENDING_WRITES_ENVIRON_KEY, None)
+    if not pending_writes:
+        return response
+    try:
+        db = get_mongo_db()
+        for collection, operations in pending_writes.items():
+            try:
+                db[collection].bulk_write(operations, ordered=False)
+            except Exception as e:
+                logger.error(f"Failed to flush {len(operations)} queued writes to {collection}: {str(e)}", extra={'session_id': session.get('sid', 'no-session-id')})
+    except Exception as e:
+        logger.error(f"Failed to flush queued writes: {str(e)}", extra={'session_id': session.get('sid', 'no-session-id')})
+    return response
+
 def requires_role(role):
     def decorator(f):
         from functools import wraps
@@ -642,7 +695,19 @@ def should_show_subscription_banner(user):
         logger.error(f"Error checking subscription banner for user {user.get('id', 'unknown')}: {str(e)}", extra={'session_id': session.get('sid', 'no-session-id')})
         return False
 
+@lru_cache(maxsize=2048)
+def _format_amount(amount):
+    """Digit-grouped amount, whole numbers without decimals; cached since reports repeat the same values."""
+    if type(amount) is int:
+        return f"{amount:,}"
+    return f"{int(amount):,}" if amount.is_integer() else f"{amount:,.2f}"
+
 def format_currency(amount, currency='₦', lang=None, include_symbol=True):
+    amount_type = type(amount)
+    if amount_type is int or amount_type is float:
+        # Fast path for numbers decoded straight from MongoDB
+        formatted = _format_amount(amount)
+        return f"{currency}{formatted}" if include_symbol else formatted
     try:
         with current_app.app_context():
             if lang is None:
@@ -662,6 +727,25 @@ def format_currency(amount, currency='₦', lang=None, include_symbol=True):
         logger.warning(f"Error formatting currency {amount}: {str(e)}", extra={'session_id': session.get('sid', 'no-session-id')})
         return f"{currency}0" if include_symbol else "0"
 
+@lru_cache(maxsize=4096)
+def _format_date_string(date_str, lang, format_type):
+    """Parse and format one date string; cached since report rows repeat the same ISO days. Raises ValueError for unparseable strings."""
+    try:
+        date_obj = datetime.strptime(date_str, '%Y-%m-%d')
+    except ValueError:
+        date_obj = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+    return _format_date_value(date_obj, lang, format_type)
+
+def _format_date_value(date_obj, lang, format_type):
+    # Ensure datetime is timezone-aware
+    date_obj_aware = date_obj.replace(tzinfo=ZoneInfo("UTC")) if date_obj.tzinfo is None else date_obj
+    if format_type == 'iso':
+        return date_obj_aware.strftime('%Y-%m-%d')
+    elif format_type == 'long':
+        return date_obj_aware.strftime('%d %B %Y' if lang == 'ha' else '%B %d, %Y')
+    else:
+        return date_obj_aware.strftime('%d/%m/%Y' if lang == 'ha' else '%m/%d/%Y')
+
 def format_date(date_obj, lang=None, format_type='short'):
     try:
         with current_app.app_context():
@@ -671,21 +755,11 @@ def format_date(date_obj, lang=None, format_type='short'):
                 return ''
             if isinstance(date_obj, str):
                 try:
-                    date_obj = datetime.strptime(date_obj, '%Y-%m-%d')
+                    return _format_date_string(date_obj, lang, format_type)
                 except ValueError:
-                    try:
-                        date_obj = datetime.fromisoformat(date_obj.replace('Z', '+00:00'))
-                    except ValueError:
-                        logger.warning(f"Invalid date format for input: {date_obj}", extra={'session_id': session.get('sid', 'no-session-id')})
-                        return date_obj
-            # Ensure datetime is timezone-aware
-            date_obj_aware = date_obj.replace(tzinfo=ZoneInfo("UTC")) if date_obj.tzinfo is None else date_obj
-            if format_type == 'iso':
-                return date_obj_aware.strftime('%Y-%m-%d')
-            elif format_type == 'long':
-                return date_obj_aware.strftime('%d %B %Y' if lang == 'ha' else '%B %d, %Y')
-            else:
-                return date_obj_aware.strftime('%d/%m/%Y' if lang == 'ha' else '%m/%d/%Y')
+                    logger.warning(f"Invalid date format for input: {date_obj}", extra={'session_id': session.get('sid', 'no-session-id')})
+                    return date_obj
+            return _format_date_value(date_obj, lang, format_type)
     except Exception as e:
         logger.warning(f"Error formatting date {date_obj}: {str(e)}", extra={'session_id': session.get('sid', 'no-session-id')})
         return str(date_obj) if date_obj else ''
@@ -693,10 +767,7 @@ def format_date(date_obj, lang=None, format_type='short'):
 def sanitize_input(input_string, max_length=None):
     if not input_string:
         return ''
-    sanitized = str(input_string).strip()
-    sanitized = re.sub(r'[<>"\']', '', sanitized)
-    if re.search(r'[<>]', sanitized):
-        logger.warning(f"Potential malicious input detected: {sanitized}", extra={'session_id': session.get('sid', 'no-session-id')})
+    sanitized = str(input_string).strip().translate(UNSAFE_INPUT_CHARS)
     if max_length and len(sanitized) > max_length:
         sanitized = sanitized[:max_length]
     return sanitized
@@ -717,22 +788,20 @@ def get_user_language():
 
 def log_user_action(action, details=None, user_id=None):
     try:
-        with current_app.app_context():
-            if user_id is None and current_user.is_authenticated:
-                user_id = current_user.id
-            session_id = session.get('sid', 'no-session-id') if has_request_context() else 'no-session-id'
-            log_entry = {
-                'user_id': user_id,
-                'session_id': session_id,
-                'action': action,
-                'details': details or {},
-                'timestamp': datetime.now(timezone.utc),
-                'ip_address': request.remote_addr if has_request_context() else None,
-                'user_agent': request.headers.get('User-Agent') if has_request_context() else None
-            }
-            db = get_mongo_db()
-            db.audit_logs.insert_one(log_entry)
-            logger.info(f"User action logged: {action} by user {user_id}", extra={'session_id': session_id, 'user_id': user_id or 'none'})
+        if user_id is None and current_user.is_authenticated:
+            user_id = current_user.id
+        session_id = session.get('sid', 'no-session-id') if has_request_context() else 'no-session-id'
+        log_entry = {
+            'user_id': user_id,
+            'session_id': session_id,
+            'action': action,
+            'details': details or {},
+            'timestamp': datetime.now(timezone.utc),
+            'ip_address': request.remote_addr if has_request_context() else None,
+            'user_agent': request.headers.get('User-Agent') if has_request_context() else None
+        }
+        queue_write('audit_logs', InsertOne(log_entry))
+        logger.info(f"User action logged: {action} by user {user_id}", extra={'session_id': session_id, 'user_id': user_id or 'none'})
     except Exception as e:
         logger.error(f"Error logging user action: {str(e)}", extra={'session_id': session_id or 'no-session-id'})
         raise
@@ -749,53 +818,83 @@ def track_user_activity(activity_type, description, amount=None, related_id=None
         user_id: Optional user ID (defaults to current_user.id)
     """
     try:
-        with current_app.app_context():
-            if user_id is None and current_user.is_authenticated:
-                user_id = current_user.id
-            
-            if not user_id:
-                logger.warning("Cannot track activity: no user ID provided")
-                return
-            
-            session_id = session.get('sid', 'no-session-id') if has_request_context() else 'no-session-id'
-            
-            activity_entry = {
-                'user_id': user_id,
-                'session_id': session_id,
-                'type': activity_type,
-                'description': description,
-                'amount': amount,
-                'related_id': related_id,
-                'timestamp': datetime.now(timezone.utc),
-                'ip_address': request.remote_addr if has_request_context() else None
-            }
-            
-            db = get_mongo_db()
-            
-            # Store in a dedicated user_activities collection for the sidebar
-            db.user_activities.insert_one(activity_entry)
-            
-            # Also log as a regular audit log
-            log_user_action(f"activity_{activity_type}", {
-                'description': description,
-                'amount': amount,
-                'related_id': related_id
-            }, user_id)
-            
-            logger.info(f"User activity tracked: {activity_type} for user {user_id}", 
-                       extra={'session_id': session_id, 'user_id': user_id})
-            
+        if user_id is None and current_user.is_authenticated:
+            user_id = current_user.id
+        
+        if not user_id:
+            logger.warning("Cannot track activity: no user ID provided")
+            return
+        
+        session_id = session.get('sid', 'no-session-id') if has_request_context() else 'no-session-id'
+        
+        activity_entry = {
+            'user_id': user_id,
+            'session_id': session_id,
+            'type': activity_type,
+            'description': description,
+            'amount': amount,
+            'related_id': related_id,
+            'timestamp': datetime.now(timezone.utc),
+            'ip_address': request.remote_addr if has_request_context() else None
+        }
+        
+        # Store in a dedicated user_activities collection for the sidebar
+        queue_write('user_activities', InsertOne(activity_entry))
+        
+        # Also log as a regular audit log
+        log_user_action(f"activity_{activity_type}", {
+            'description': description,
+            'amount': amount,
+            'related_id': related_id
+        }, user_id)
+        
+        logger.info(f"User activity tracked: {activity_type} for user {user_id}", 
+                   extra={'session_id': session_id, 'user_id': user_id})
+        
     except Exception as e:
         logger.error(f"Error tracking user activity: {str(e)}", 
                     extra={'session_id': session.get('sid', 'no-session-id') if has_request_context() else 'no-session-id'})
         # Don't raise the exception to avoid breaking the main functionality
 
+def _orjson_default(obj):
+    """Encode types orjson passes through the way Flask's default provider does: dates as HTTP dates, __html__ as markup."""
+    if isinstance(obj, date):
+        return http_date(obj)
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+    return str(obj)
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider backed by orjson for jsonify() and API responses.
+
+    Output matches Flask's default provider: keys are sorted, datetimes and
+    dates are RFC 822 HTTP dates (e.g. "Mon, 01 Jan 2024 00:00:00 GMT", naive
+    values taken as UTC) and non-string dict keys are stringified as json.dumps
+    does. ObjectId and other unsupported types fall back to str() instead of
+    raising. Calls that pass json.dumps keyword arguments (e.g. indent for the
+    tojson filter) use the default encoder.
+    """
+    options = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=_orjson_default, option=self.options).decode('utf-8')
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=_orjson_default, option=self.options),
+            mimetype=self.mimetype
+        )
+
 __all__ = [
     'clean_currency', 'log_tool_usage', 'get_limiter', 'create_anonymous_session', 
-    'is_valid_email', 'get_mongo_db', 'requires_role', 'is_admin', 'can_user_interact',
+    'is_valid_email', 'get_mongo_db', 'queue_write', 'flush_pending_writes', 'requires_role', 'is_admin', 'can_user_interact',
     'should_show_subscription_banner', 'format_currency', 'format_date', 'sanitize_input', 'generate_unique_id', 
     'validate_required_fields', 'get_user_language', 'log_user_action', 'track_user_activity',
     'initialize_tools_with_urls', 'TRADER_TOOLS', 
     'TRADER_NAV', 'STARTUP_TOOLS', 'STARTUP_NAV', 'ADMIN_TOOLS', 'ADMIN_NAV', 
-    'ALL_TOOLS', 'get_explore_features'
+    'ALL_TOOLS', 'get_explore_features', 'ORJSONProvider'
 ]